@@ -0,0 +1,52 @@
+import os
+
+from setuptools import Extension, setup
+
+# Reads files relative to this script rather than the current directory.
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+def readme():
+    with open(os.path.join(ROOT, 'README.md')) as f:
+        return f.read();
+
+def license():
+    with open(os.path.join(ROOT, 'LICENSE')) as f:
+        return f.read();
+
+setup(
+    name='whistful-hearts',
+    version='0.0.1',
+    description='',
+    long_description=readme(),
+    url='https://github.com/eyeonechi/whistful-hearts',
+    author='Ivan Ken Weng Chee',
+    author_email='ichee@student.unimelb.edu.au',
+    license=license(),
+    keywords=[
+        'card'
+    ],
+    scripts=[],
+    packages=['whistful_hearts'],
+    package_dir={'': 'src'},
+    package_data={
+        'whistful_hearts': ['openings.bin', 'predictor.json']
+    },
+    # Compiled kernels, skipped if they cannot be built, in which case
+    # the package falls back to pure Python.
+    ext_modules=[
+        Extension('whistful_hearts._speedups', ['src/whistful_hearts/_speedups.c'], optional=True)
+    ],
+    extras_require={
+        'batch': ['numpy']
+    },
+    entry_points={
+        'console_scripts': [
+            'whistful-hearts-tournament=whistful_hearts.tournament:main',
+            'whistful-hearts-benchmark=whistful_hearts.benchmark:main',
+            'whistful-hearts-server=whistful_hearts.server:main',
+            'whistful-hearts-replay=whistful_hearts.replay:main'
+        ]
+    },
+    zip_safe=False,
+    include_package_data=True
+)
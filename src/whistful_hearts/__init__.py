@@ -0,0 +1,45 @@
+'''Bot for Whistful Hearts. The public API is imported lazily on first
+access, so importing the package itself loads nothing else, and names
+not listed below are looked up in the 'core' module. Settings such as
+'ENDGAME_CARDS' are read from 'core', so should be set there.'''
+
+import importlib
+
+# Modules defining each public name, other than those of 'core'.
+MODULES = {
+    'Game': 'engine', 'play_game': 'engine',
+    'run_tournament': 'tournament',
+    'score_batch': 'batch', 'encode_games': 'batch',
+    'Search': 'search',
+    'solve_play': 'endgame',
+    'RecordReader': 'records', 'RecordWriter': 'records', 'to_records': 'records',
+    'validate_file': 'replay',
+    'predict_scores': 'predictor',
+    'Server': 'server', 'Client': 'server',
+}
+
+# Modules needing NumPy, installed with the 'batch' extra. Their names
+# still resolve on access, but are left out of '__all__' so that
+# 'from whistful_hearts import *' works without it.
+NUMPY_MODULES = ('batch', 'records', 'predictor')
+
+__all__ = [
+    'play', 'score_game', 'score_games', 'is_valid_play', 'is_broken_hearts', 'legal_moves',
+    'predict_score', 'get_winner_score', 'PlayerData', 'Strategy', 'STRATEGY',
+] + sorted(name for name, module in MODULES.items() if module not in NUMPY_MODULES)
+
+
+def __getattr__(name):
+    if name.startswith('__'):
+        raise AttributeError(name)
+    module = importlib.import_module('.' + MODULES.get(name, 'core'), __name__)
+    try:
+        value = getattr(module, name)
+    except AttributeError:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name)) from None
+    globals()[name] = value
+    return(value)
+
+
+def __dir__():
+    return(sorted(set(globals()) | set(__all__)))
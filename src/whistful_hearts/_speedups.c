@@ -0,0 +1,184 @@
+/* Compiled versions of the card and trick kernels of 'core', used in
+ * place of the pure Python ones when this extension has been built.
+ * Each function behaves as the one of the same name in 'core.py'. */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+static const char PIPS[] = "234567890JQKA";
+static const char SUITS[] = "CDHS";
+
+/* Returns the id of a length 2 string, as 13 * suit + (pip - 2), or
+ * sets KeyError and returns -1 if it is not a card. */
+static int card_id(PyObject *card)
+{
+    if (PyUnicode_Check(card) && PyUnicode_GET_LENGTH(card) == 2) {
+        Py_UCS4 pip = PyUnicode_READ_CHAR(card, 0);
+        Py_UCS4 suit = PyUnicode_READ_CHAR(card, 1);
+        const char *p = pip < 128 && pip ? strchr(PIPS, (int)pip) : NULL;
+        const char *s = suit < 128 && suit ? strchr(SUITS, (int)suit) : NULL;
+        if (p && s)
+            return 13 * (int)(s - SUITS) + (int)(p - PIPS);
+    }
+    PyErr_SetObject(PyExc_KeyError, card);
+    return -1;
+}
+
+/* Returns the position of the winning card among n card ids, given
+ * the trump suit, or -1 for none, and the 0-based round ID. */
+static Py_ssize_t winner_of(const int *ids, Py_ssize_t n, int trump, Py_ssize_t index)
+{
+    /* Trumps win the 3 preliminary rounds, otherwise the lead suit. */
+    int suit = ids[0] / 13;
+    Py_ssize_t position, winner = -1;
+    if (index <= 2 && trump != suit) {
+        for (position = 0; position < n; position++) {
+            if (ids[position] / 13 == trump) {
+                suit = trump;
+                break;
+            }
+        }
+    }
+
+    /* Ids of a suit are ordered by pip, so the largest one wins. */
+    for (position = 0; position < n; position++) {
+        if (ids[position] / 13 == suit && (winner < 0 || ids[position] > ids[winner]))
+            winner = position;
+    }
+    return winner;
+}
+
+/* Reads the trump argument, None or a suit index, as -1 or the suit. */
+static int read_trump(PyObject *trump, int *suit)
+{
+    if (trump == Py_None) {
+        *suit = -1;
+        return 0;
+    }
+    *suit = (int)PyLong_AsLong(trump);
+    return *suit == -1 && PyErr_Occurred() ? -1 : 0;
+}
+
+static PyObject *card_mask(PyObject *self, PyObject *cards)
+{
+    PyObject *iterator = PyObject_GetIter(cards), *card;
+    unsigned long long mask = 0;
+    if (!iterator)
+        return NULL;
+    while ((card = PyIter_Next(iterator))) {
+        int id = card_id(card);
+        Py_DECREF(card);
+        if (id < 0) {
+            Py_DECREF(iterator);
+            return NULL;
+        }
+        mask |= 1ULL << id;
+    }
+    Py_DECREF(iterator);
+    if (PyErr_Occurred())
+        return NULL;
+    return PyLong_FromUnsignedLongLong(mask);
+}
+
+static PyObject *trick_winner(PyObject *self, PyObject *args)
+{
+    PyObject *sequence, *fast;
+    int trump, ids[52];
+    Py_ssize_t index, position, n;
+    if (!PyArg_ParseTuple(args, "OOn", &sequence, &fast, &index) || read_trump(fast, &trump) < 0)
+        return NULL;
+    if (!(fast = PySequence_Fast(sequence, "ids must be a sequence")))
+        return NULL;
+
+    n = PySequence_Fast_GET_SIZE(fast);
+    if (n == 0 || n > 52) {
+        Py_DECREF(fast);
+        PyErr_SetString(n ? PyExc_ValueError : PyExc_IndexError, n ? "too many cards in trick" : "trick has no cards");
+        return NULL;
+    }
+    for (position = 0; position < n; position++) {
+        long id = PyLong_AsLong(PySequence_Fast_GET_ITEM(fast, position));
+        if (id == -1 && PyErr_Occurred()) {
+            Py_DECREF(fast);
+            return NULL;
+        }
+        if (id < 0 || id > 51) {
+            Py_DECREF(fast);
+            PyErr_SetString(PyExc_IndexError, "card id out of range");
+            return NULL;
+        }
+        ids[position] = (int)id;
+    }
+    Py_DECREF(fast);
+    return PyLong_FromSsize_t(winner_of(ids, n, trump, index));
+}
+
+static PyObject *score_tricks(PyObject *self, PyObject *args)
+{
+    PyObject *sequence, *trumpObject, *tricks;
+    long score[4] = {0, 0, 0, 0};
+    int trump, ids[52];
+    long moon = 0;
+    Py_ssize_t leader = 0, index, position;
+    if (!PyArg_ParseTuple(args, "OO", &sequence, &trumpObject) || read_trump(trumpObject, &trump) < 0)
+        return NULL;
+    if (!(tricks = PySequence_Fast(sequence, "tricks must be a sequence")))
+        return NULL;
+
+    /* Walks the tricks once, resolving each winner relative to the
+     * leader of the trick and crediting them with its points. */
+    for (index = 0; index < PySequence_Fast_GET_SIZE(tricks); index++) {
+        PyObject *trick = PySequence_Fast(PySequence_Fast_GET_ITEM(tricks, index), "trick must be a sequence");
+        Py_ssize_t n;
+        long points = 0;
+        if (!trick)
+            goto error;
+        n = PySequence_Fast_GET_SIZE(trick);
+        if (n == 0 || n > 52) {
+            Py_DECREF(trick);
+            PyErr_SetString(n ? PyExc_ValueError : PyExc_IndexError, n ? "too many cards in trick" : "trick has no cards");
+            goto error;
+        }
+        for (position = 0; position < n; position++) {
+            int id = card_id(PySequence_Fast_GET_ITEM(trick, position));
+            if (id < 0) {
+                Py_DECREF(trick);
+                goto error;
+            }
+            ids[position] = id;
+
+            /* Hearts score 1, the Queen of Spades 13, and both count
+             * towards shooting the moon. */
+            if (id / 13 == 2 || id == 49) {
+                points += id == 49 ? 13 : 1;
+                moon += 1;
+            }
+        }
+        Py_DECREF(trick);
+        leader = (leader + winner_of(ids, n, trump, index)) % 4;
+        if (index > 2)
+            score[leader] += points;
+    }
+    Py_DECREF(tricks);
+    return Py_BuildValue("[llll]ln", score[0], score[1], score[2], score[3], moon, leader);
+
+error:
+    Py_DECREF(tricks);
+    return NULL;
+}
+
+static PyMethodDef methods[] = {
+    {"card_mask", card_mask, METH_O, "Returns the hand mask for an iterable of length 2 strings."},
+    {"trick_winner", trick_winner, METH_VARARGS, "Returns the position of the winning card in a trick of card ids,\ngiven the trump suit and the 0-based round ID."},
+    {"score_tricks", score_tricks, METH_VARARGS, "Returns the points taken by each seat over a list of tricks, the\nnumber of cards counting towards shooting the moon, and the seat to\nlead the next trick, given the trump suit."},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef module = {
+    PyModuleDef_HEAD_INIT, "_speedups", "Compiled card and trick kernels.", -1, methods
+};
+
+PyMODINIT_FUNC PyInit__speedups(void)
+{
+    return PyModule_Create(&module);
+}
@@ -0,0 +1,60 @@
+import numpy as np
+
+from .core import CARD_ID, MOON, POINTS
+
+# Per-card point and moon tables indexed by card id.
+POINTS_TABLE = np.array(POINTS, dtype=np.int16)
+MOON_TABLE = np.array(MOON, dtype=np.int16)
+
+
+def encode_games(games):
+    '''Returns a pair of int8 arrays of card ids, shaped (N, 13, 4) for
+    the tricks and (N, 3) for 'deck_top', for a list of (tricks,
+    deck_top) pairs of length 2 strings.'''
+    tricks = np.array([[[CARD_ID[card] for card in trick] for trick in game[0]] for game in games], dtype=np.int8)
+    deck_top = np.array([[CARD_ID[card] for card in game[1]] for game in games], dtype=np.int8)
+    return(tricks, deck_top)
+
+
+def trick_winners(tricks, deck_top):
+    '''Returns an (N, T) array of the position of the winning card in
+    each trick, as 'Player' would determine it.'''
+    tricks = tricks.astype(np.int16)
+    suits = tricks // 13
+    lead = suits[:, :, :1]
+    trump = (deck_top[:, :1].astype(np.int16) // 13)[:, :, None]
+
+    # Trumps win the 3 preliminary rounds when played, otherwise the
+    # lead suit wins.
+    preliminary = (np.arange(tricks.shape[1]) <= 2)[None, :, None]
+    trumped = preliminary & (suits == trump).any(axis=2, keepdims=True)
+    suit = np.where(trumped, trump, lead)
+
+    # Ids of a suit are ordered by pip, so the largest contender wins.
+    return(np.where(suits == suit, tricks, -1).argmax(axis=2))
+
+
+def score_batch(tricks, deck_top):
+    '''Returns the winning seat of each trick as an (N, T) array, the
+    scores of each player as an (N, 4) array, and whether each game was
+    won by shooting the moon as an (N,) array, for arrays shaped as
+    returned by 'encode_games'. Scores match 'score_game'.'''
+    tricks = np.asarray(tricks)
+    deck_top = np.asarray(deck_top)
+    ids = tricks.astype(np.intp)
+
+    # Each trick is led by the winner of the last, so the winning seat
+    # is the running sum of winning positions, starting with seat 0.
+    winners = (np.cumsum(trick_winners(tricks, deck_top), axis=1) % 4).astype(np.int8)
+
+    # Points of the scoring rounds are credited to the winning seat.
+    points = POINTS_TABLE[ids].sum(axis=2)
+    points[:, :3] = 0
+    seats = winners[:, :, None] == np.arange(4, dtype=np.int8)
+    scores = (points[:, :, None] * seats).sum(axis=1)
+
+    # Negates the scores of games where a player has shot the moon.
+    moon = MOON_TABLE[ids].sum(axis=(1, 2))
+    shoot = (moon == 14) & ((scores == 0).sum(axis=1) == 3)
+    scores = np.where(shoot[:, None], -scores, scores)
+    return(winners, scores, shoot)
@@ -0,0 +1,127 @@
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+
+from .core import get_winner_score, is_broken_hearts, is_valid_play, play, predict_score, score_game
+from .engine import Game
+
+
+class Recorder():
+    '''Class of an agent playing as 'play' does while recording the
+    arguments of every call, for use as a benchmark corpus.'''
+
+    def __init__(self, states):
+        self.states = states
+
+    def __call__(self, curr_trick, hand, prev_tricks, deck_top, player_data=None):
+        self.states.append((list(curr_trick), list(hand), list(prev_tricks), list(deck_top)))
+        return(play(curr_trick, hand, prev_tricks, deck_top, player_data=player_data))
+
+
+class Corpus():
+    '''Class of a seeded corpus of self-play games, with the game state of
+    every move grouped by trick index from 1 to 13.'''
+
+    def __init__(self, games=200, seed=0):
+        '''Accepts the number of games to play and a seed.'''
+        self.games = []
+        self.states = []
+        recorder = Recorder(self.states)
+        for index in range(games):
+            game = Game([recorder] * 4, '%s:%d' % (seed, index))
+            self.games.append((game.tricks, game.deck_top))
+
+        # States by trick index, as 'play' numbers its rounds.
+        self.byTrick = {index: [state for state in self.states if len(state[2]) + 1 == index] for index in range(1, 14)}
+
+
+def measure(function, cases, repeat=5):
+    '''Returns timings of calling a function on each tuple of arguments
+    in a list of cases, keeping the best of several repeats.'''
+    best = float('inf')
+    for attempt in range(repeat):
+        start = time.perf_counter()
+        for args in cases:
+            function(*args)
+        best = min(best, time.perf_counter() - start)
+    return({'calls': len(cases), 'seconds': best, 'microsecondsPerCall': best / len(cases) * 1e6, 'callsPerSecond': len(cases) / best if best else None})
+
+
+def suppressed_play(curr_trick, hand, prev_tricks, deck_top):
+    return(play(curr_trick, hand, prev_tricks, deck_top, suppress_player_data=True))
+
+
+def run_benchmarks(games=200, seed=0, repeat=5):
+    '''Returns a dictionary of benchmark results over a seeded corpus.'''
+    corpus = Corpus(games, seed)
+    states = corpus.states
+    results = {}
+
+    # Microbenchmarks of each public function over the corpus.
+    results['play'] = measure(suppressed_play, states, repeat)
+    results['score_game'] = measure(score_game, corpus.games, repeat)
+    results['is_valid_play'] = measure(is_valid_play, [(card, curr, hand, prev) for curr, hand, prev, deck in states for card in hand], repeat)
+    results['is_broken_hearts'] = measure(is_broken_hearts, [(prev, curr) for curr, hand, prev, deck in states], repeat)
+    results['predict_score'] = measure(predict_score, [(hand,) for curr, hand, prev, deck in states], repeat)
+    results['get_winner_score'] = measure(get_winner_score, [(trick, index + 1, deck) for tricks, deck in corpus.games for index, trick in enumerate(tricks)], repeat)
+
+    # Cost of 'play' at each trick index, which should stay flat.
+    results['play_by_trick'] = {str(index): measure(suppressed_play, corpus.byTrick[index], repeat) for index in range(1, 14)}
+
+    # End to end games per second of self-play.
+    start = time.perf_counter()
+    for index in range(games):
+        Game([play] * 4, '%s:e2e:%d' % (seed, index))
+    seconds = time.perf_counter() - start
+    results['games'] = {'games': games, 'seconds': seconds, 'gamesPerSecond': games / seconds}
+    return(results)
+
+
+def commit():
+    '''Returns the current git commit, or None outside a repository.'''
+    try:
+        return(subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], stderr=subprocess.DEVNULL).decode().strip())
+    except (OSError, subprocess.CalledProcessError):
+        return(None)
+
+
+def compare(old, new):
+    '''Returns lines comparing the calls per second of two reports.'''
+    lines = []
+    for name in sorted(new['results']):
+        before, after = old['results'].get(name, {}), new['results'][name]
+        rate = 'gamesPerSecond' if name == 'games' else 'callsPerSecond'
+        if rate in before and rate in after and before[rate]:
+            lines.append('%-18s %12.1f -> %12.1f  (x%.2f)' % (name, before[rate], after[rate], after[rate] / before[rate]))
+    return(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmarks the public functions of the bot.')
+    parser.add_argument('--games', type=int, default=200)
+    parser.add_argument('--seed', default=0)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', help='file to write the JSON report to')
+    parser.add_argument('--compare', help='JSON report of an earlier run to compare against')
+    args = parser.parse_args()
+
+    report = {
+        'meta': {'commit': commit(), 'python': sys.version.split()[0], 'platform': platform.platform(), 'games': args.games, 'seed': args.seed, 'repeat': args.repeat},
+        'results': run_benchmarks(args.games, args.seed, args.repeat),
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+    else:
+        print(json.dumps(report, indent=2, sort_keys=True))
+
+    if args.compare:
+        with open(args.compare) as f:
+            print('\n'.join(compare(json.load(f), report)))
+
+
+if __name__ == '__main__':
+    main()
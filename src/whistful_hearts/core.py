@@ -0,0 +1,956 @@
+import os
+import zlib
+
+from . import instrument
+
+# Suits and pips in the order used by the integer card encoding. A card
+# id is 13 * suit + (pip - 2), so ids 0-51 run from '2C' up to 'AS'.
+SUITS = 'CDHS'
+PIPS = '234567890JQKA'
+
+# Interned tables indexed by card id, built once at import time.
+DECK = tuple(pip + suit for suit in SUITS for pip in PIPS)
+CARD_ID = {card: index for index, card in enumerate(DECK)}
+SUIT = tuple(index // 13 for index in range(52))
+RANK = tuple(index % 13 + 2 for index in range(52))
+IS_HEARTS = tuple(SUITS[SUIT[index]] == 'H' for index in range(52))
+IS_QUEEN_SPADES = tuple(DECK[index] == 'QS' for index in range(52))
+
+# Points won with each card in the scoring rounds, and whether a card
+# counts towards shooting the moon.
+POINTS = tuple(1 if IS_HEARTS[index] else 13 if IS_QUEEN_SPADES[index] else 0 for index in range(52))
+MOON = tuple(1 if POINTS[index] else 0 for index in range(52))
+
+
+def card_ids(cards):
+    '''Returns a list of card ids for an iterable of length 2 strings.'''
+    return([CARD_ID[card] for card in cards])
+
+
+# Bit masks of each suit's 13-bit lane in a hand mask, where bit n is
+# set when the card with id n is held.
+LANE = (1 << 13) - 1
+SUIT_MASK = tuple(LANE << (13 * suit) for suit in range(4))
+HEARTS_MASK = SUIT_MASK[SUITS.index('H')]
+QUEEN_SPADES = CARD_ID['QS']
+QUEEN_SPADES_MASK = 1 << QUEEN_SPADES
+
+# Counts the set bits of a mask, falling back for older Pythons.
+try:
+    popcount = int.bit_count
+except AttributeError:
+    def popcount(mask):
+        return(bin(mask).count('1'))
+
+
+def trick_winner(ids, trump, index):
+    '''Returns the position of the winning card in a trick of card ids,
+    given the trump suit and the 0-based round ID.'''
+    # Trumps win the 3 preliminary rounds, otherwise the lead suit.
+    suit = SUIT[ids[0]]
+    if index <= 2 and trump != suit:
+        for card in ids:
+            if SUIT[card] == trump:
+                suit = trump
+                break
+
+    # Ids of a suit are ordered by pip, so the largest one wins.
+    winner = None
+    for position, card in enumerate(ids):
+        if SUIT[card] == suit and (winner is None or card > ids[winner]):
+            winner = position
+    return(winner)
+
+
+def score_tricks(tricks, trump):
+    '''Returns the points taken by each seat over a list of tricks of
+    length 2 strings, the number of cards played counting towards
+    shooting the moon, and the seat to lead the next trick, given the
+    trump suit.'''
+    score = [0, 0, 0, 0]
+    moon = 0
+    leader = 0
+    for index, trick in enumerate(tricks):
+        ids = [CARD_ID[card] for card in trick]
+        points = 0
+        for card in ids:
+            points += POINTS[card]
+            moon += MOON[card]
+        leader = (leader + trick_winner(ids, trump, index)) % 4
+        if index > 2:
+            score[leader] += points
+    return(score, moon, leader)
+
+
+def card_mask(cards):
+    '''Returns the hand mask for an iterable of length 2 strings.'''
+    mask = 0
+    for card in cards:
+        mask |= 1 << CARD_ID[card]
+    return(mask)
+
+
+# Compiled kernels of the optional '_speedups' extension replace the
+# ones above when it has been built, unless WHISTFUL_HEARTS_PURE is set
+# in the environment to keep to pure Python.
+SPEEDUPS = False
+if not os.environ.get('WHISTFUL_HEARTS_PURE'):
+    try:
+        from ._speedups import card_mask, score_tricks, trick_winner
+        SPEEDUPS = True
+    except ImportError:
+        pass
+
+
+def highest_id(mask):
+    '''Returns the id of the highest card in a mask, breaking ties in
+    pip by suit letter, or None if the mask is empty.'''
+    ranks = (mask | mask >> 13 | mask >> 26 | mask >> 39) & LANE
+    if not ranks:
+        return(None)
+    rank = ranks.bit_length() - 1
+    for suit in (39, 26, 13, 0):
+        if mask >> (suit + rank) & 1:
+            return(suit + rank)
+
+
+def lowest_id(mask):
+    '''Returns the id of the lowest card in a mask, breaking ties in
+    pip by suit letter, or None if the mask is empty.'''
+    ranks = (mask | mask >> 13 | mask >> 26 | mask >> 39) & LANE
+    if not ranks:
+        return(None)
+    rank = (ranks & -ranks).bit_length() - 1
+    for suit in (0, 13, 26, 39):
+        if mask >> (suit + rank) & 1:
+            return(suit + rank)
+
+
+def highest_card(mask):
+    '''Returns the highest card of a mask as a string, or False if the
+    mask is empty.'''
+    return(DECK[highest_id(mask)] if mask else False)
+
+
+def lowest_card(mask):
+    '''Returns the lowest card of a mask as a string, or False if the
+    mask is empty.'''
+    return(DECK[lowest_id(mask)] if mask else False)
+
+
+class HandMask():
+    '''Class of a set of cards held as a 52-bit integer with one 13-bit
+    lane per suit. Behaves like a list of length 2 strings in card id
+    order, and computes its attributes lazily on access.'''
+
+    __slots__ = ('mask',)
+
+    def __init__(self, cards=0):
+        '''Accepts an iterable of length 2 strings or a mask.'''
+        if instrument.PROBE:
+            instrument.PROBE.count('HandMask')
+        self.mask = cards if type(cards) == int else card_mask(cards)
+
+    def __len__(self):
+        return(popcount(self.mask))
+
+    def __contains__(self, card):
+        return(bool(self.mask >> CARD_ID[card] & 1))
+
+    def __iter__(self):
+        mask = self.mask
+        while mask:
+            low = mask & -mask
+            yield DECK[low.bit_length() - 1]
+            mask ^= low
+
+    def __eq__(self, other):
+        return(isinstance(other, HandMask) and self.mask == other.mask)
+
+    def __hash__(self):
+        return(hash(self.mask))
+
+    def __repr__(self):
+        return('HandMask(%r)' % list(self))
+
+    def suit(self, suit):
+        '''Returns the cards of the given suit letter.'''
+        return(HandMask(self.mask & SUIT_MASK[SUITS.index(suit)]))
+
+    def counts(self):
+        '''Returns the number of cards held in each suit, in the order of
+        'SUITS'.'''
+        mask = self.mask
+        return(tuple(popcount(mask >> (13 * suit) & LANE) for suit in range(4)))
+
+    @property
+    def count(self):
+        return(popcount(self.mask))
+
+    @property
+    def highest(self):
+        return(highest_card(self.mask))
+
+    @property
+    def lowest(self):
+        return(lowest_card(self.mask))
+
+    @property
+    def hearts(self):
+        return(HandMask(self.mask & HEARTS_MASK))
+
+    @property
+    def allHearts(self):
+        return(not self.mask & ~HEARTS_MASK)
+
+    @property
+    def hasQueenSpades(self):
+        return(bool(self.mask & QUEEN_SPADES_MASK))
+
+
+class Card():
+    '''Class regarding card objects. Cards are interned, so there is only
+    ever one object per card.'''
+
+    __slots__ = ('id', 'suit', 'pip', 'isHearts', 'isQueenSpades')
+    _cards = {}
+
+    def __new__(cls, card):
+        '''Accepts length 2 strings or card ids as the argument.'''
+        if instrument.PROBE:
+            instrument.PROBE.count('Card')
+        index = card if type(card) == int else CARD_ID[card]
+        self = cls._cards.get(index)
+        if self is None:
+            self = object.__new__(cls)
+
+            # Card id, suit and pip value of a card respectively.
+            self.id = index
+            self.suit = SUITS[SUIT[index]]
+            self.pip = str(RANK[index])
+
+            # Checks whether a card is a Heart or the Queen of Spades.
+            self.isHearts = IS_HEARTS[index]
+            self.isQueenSpades = IS_QUEEN_SPADES[index]
+            cls._cards[index] = self
+        return(self)
+
+    def __repr__(self):
+        return('Card(%r)' % DECK[self.id])
+
+
+class Trick():
+    '''Class for trick objects. 'curr_trick', 'prev_tricks' and 'deck_top'
+    are passed to this class.'''
+
+    def __init__(self, trick):
+        '''Accepts tuples or lists as the argument.'''
+        if instrument.PROBE:
+            instrument.PROBE.count('Trick')
+
+        # Whether player is the leader for the current trick,
+        # whether game is in the preliminary or scoring rounds,
+        # and filters the 10 scoring rounds.
+        self.isLead = len(trick) == 0
+        self.isRounds10 = len(trick) > 2
+        self.Rounds10 = trick[3:] if self.isRounds10 else []
+
+        # Card ids of the trick, flattening a list of tricks.
+        self.ids = card_ids(trick) if self.isLead or type(trick[0]) == str else [CARD_ID[card] for cards in trick for card in cards]
+
+        # Determines trump and lead of trick respectively,
+        # and whether trick contains Hearts.
+        self.trump = SUITS[SUIT[self.ids[0]]] if not self.isLead else None
+        self.lead = self.trump
+        self.hasHearts = any(IS_HEARTS[index] for index in self.ids)
+
+
+class Hand():
+    '''Class of the 'hand' of a player. Attributes are computed lazily
+    from the hand mask when first read.'''
+
+    def __init__(self, hand, trump=False, lead=False, suit=False):
+        '''Accepts list as argument, with optional trump, lead and/or
+        specific suit to check for.'''
+        if instrument.PROBE:
+            instrument.PROBE.count('Hand')
+        self.hand = hand
+        self.mask = card_mask(hand)
+        self.suit = suit
+
+        # Lanes of the trump and lead suits, empty when not given.
+        self.trumpMask = SUIT_MASK[SUITS.index(trump)] if trump else 0
+        self.leadMask = SUIT_MASK[SUITS.index(lead)] if lead else 0
+
+    def filter(self, mask):
+        '''Returns the cards of the hand within a mask, in hand order.'''
+        return([card for card in self.hand if mask >> CARD_ID[card] & 1])
+
+    # Checks condition of hand if having leads or not, if hand
+    # contains the Queen of Spades or if hand is full of hearts.
+    @property
+    def noLead(self):
+        return(bool(self.leadMask) and not self.mask & self.leadMask)
+
+    @property
+    def hasLead(self):
+        return(bool(self.mask & self.leadMask))
+
+    @property
+    def hasQueenSpades(self):
+        return(bool(self.mask & QUEEN_SPADES_MASK))
+
+    @property
+    def allHearts(self):
+        return(not self.mask & ~HEARTS_MASK)
+
+    # Checks for the highest and lowest card in hand respectively.
+    @property
+    def highest(self):
+        return(highest_card(self.mask) if not self.suit else False)
+
+    @property
+    def lowest(self):
+        return(lowest_card(self.mask) if not self.suit else False)
+
+    # Sublists containing all trumps, leads, hearts, and other suits.
+    @property
+    def trumps(self):
+        return(self.filter(self.trumpMask))
+
+    @property
+    def leads(self):
+        return(self.filter(self.leadMask))
+
+    @property
+    def hearts(self):
+        return(self.filter(HEARTS_MASK))
+
+    @property
+    def others(self):
+        return(self.filter(~(self.trumpMask | self.leadMask)))
+
+    # Counts hand for the number of cards of suit respective to
+    # that defined in argument 'suit'.
+    @property
+    def count(self):
+        return(popcount(self.mask & SUIT_MASK[SUITS.index(self.suit)]) if self.suit else False)
+
+
+class Score():
+    '''Class relating to calculating scores of players in a game.'''
+
+    def __init__(self, tricks, deck_top):
+        '''Accepts a list of tricks and overturned cards as arguments.'''
+        # Walks the tricks once, resolving each winner relative to the
+        # leader of the trick and crediting them with its points, along
+        # with the counter for shooting the moon.
+        trump = SUIT[CARD_ID[deck_top[0]]] if tricks else None
+        self.score, self.moon, leader = score_tricks(tricks, trump)
+
+        # Ordering of players for the next trick, starting with the
+        # winner of the last trick.
+        self.order = [(leader + offset) % 4 for offset in range(4)]
+
+        # Determines whether a player has shot the moon, in which case
+        # all point-bearing cards have been played and all but one player
+        # has 0 points as scores.
+        self.shoot = self.moon == 14 and self.score.count(0) == 3
+
+
+class Player():
+    '''Class considering aspects of entities playing the game.'''
+
+    def __init__(self, order, trick, deck, index):
+        '''Accepts player ordering, 'curr_trick', 'deck_top' and
+        the current round ID.'''
+        ids = card_ids(trick)
+
+        # Determines the winning and losing card respectively, with
+        # trumps > leads > rest as contenders.
+        self.winner = trick_winner(ids, SUIT[CARD_ID[deck[0]]], index)
+        suit = SUIT[ids[self.winner]]
+        contenders = [card for card in ids if SUIT[card] == suit]
+        self.contenders = [DECK[card] for card in contenders]
+        self.loser = ids.index(min(contenders))
+
+        # Switches order of players for use in the next round.
+        self.order = [order[(self.winner + offset) % 4] for offset in range(4)]
+
+        # Determines the winner's score and point relating to shooting
+        # the moon for a given round based on Hearts and Queen of Spades.
+        self.score = sum(POINTS[card] for card in ids) if index > 2 else 0
+        self.moon = sum(MOON[card] for card in ids)
+
+
+class PlayerData(dict):
+    '''Class of the state passed on as 'player_data' between calls to
+    'play' within a game. Items are the data of the latest call, while
+    attributes carry what has been seen of 'prev_tricks' so far, so each
+    call only applies the tricks completed since the previous one.'''
+
+    def __init__(self, deck):
+        '''Accepts the 'deck_top' of the game.'''
+        dict.__init__(self)
+        self.deck = list(deck) if deck else []
+        self.trump = Card(deck[0]).suit if deck else False
+        self.trumpSuit = SUITS.index(self.trump) if deck else None
+
+        # Number of tricks applied, the last one applied, cards played
+        # in them per suit, and whether they have broken hearts.
+        self.tricks = 0
+        self.last = None
+        self.played = [0, 0, 0, 0]
+        self.heartsBroken = False
+
+        # Seat leading the next trick, with seat 0 leading the first,
+        # a bit for each suit a seat is known to be void in, and the
+        # seat taking each overturned card won so far.
+        self.leader = 0
+        self.voids = [0, 0, 0, 0]
+        self.prizes = {}
+
+    @classmethod
+    def resume(cls, prev, deck, state=None):
+        '''Returns 'state' advanced to the given 'prev_tricks' if it
+        belongs to the same game, or else a new state for the game.'''
+        if not (isinstance(state, cls) and state.matches(prev, deck)):
+            state = cls(deck)
+        state.advance(prev)
+        return(state)
+
+    def matches(self, prev, deck):
+        '''Returns True if this state belongs to the game of the given
+        'prev_tricks' and 'deck_top', and False otherwise.'''
+        return(self.deck == list(deck or ()) and self.tricks <= len(prev) and (self.tricks == 0 or tuple(prev[self.tricks - 1]) == self.last))
+
+    def advance(self, prev):
+        '''Applies the tricks of 'prev_tricks' not seen before.'''
+        for index in range(self.tricks, len(prev)):
+            ids = [CARD_ID[card] for card in prev[index]]
+            for position, card in enumerate(ids):
+                self.played[SUIT[card]] += 1
+                if index > 2:
+                    if IS_HEARTS[card]:
+                        self.heartsBroken = True
+
+                    # Players failing to follow suit once the last cards
+                    # have been drawn are taken to be void in the lead
+                    # suit. The rules allow any suit, but every player of
+                    # this module follows when it can, see 'follow_suit'.
+                    if SUIT[card] != SUIT[ids[0]]:
+                        self.voids[(self.leader + position) % 4] |= 1 << SUIT[ids[0]]
+            if ids:
+                self.leader = (self.leader + trick_winner(ids, self.trumpSuit, index)) % 4
+                if index < min(len(self.deck), 3):
+                    self.prizes[self.deck[index]] = self.leader
+        if len(prev) > self.tricks:
+            self.tricks = len(prev)
+            self.last = tuple(prev[-1])
+
+    def broken(self, curr_trick=()):
+        '''Returns True if hearts are broken as of the tricks applied
+        and 'curr_trick', as 'is_broken_hearts' would.'''
+        return(self.heartsBroken or (self.tricks > 3 and len(curr_trick) > 0))
+
+    def is_broken_hearts(self, prev_tricks, curr_trick=()):
+        '''Returns the same as 'is_broken_hearts' for the same game,
+        applying only the tricks of 'prev_tricks' not seen before.'''
+        self.advance(prev_tricks)
+        return(self.broken(curr_trick))
+
+    def seat(self, curr_trick=()):
+        '''Returns the seat of the player to play to 'curr_trick'.'''
+        return((self.leader + len(curr_trick)) % 4)
+
+
+def legal_mask(mask, leading, scoring, broken):
+    '''Returns the mask of the cards of a hand mask that may be played,
+    given whether the player leads the trick, whether the game is in the
+    10 scoring rounds, and whether hearts are broken.'''
+    # Hearts may only be played in the scoring rounds once broken, or
+    # when leading with a hand of only Hearts.
+    if scoring and not broken and not (leading and not mask & ~HEARTS_MASK):
+        return(mask & ~HEARTS_MASK)
+    return(mask)
+
+
+def legal_moves(state, hand=None, curr_trick=None, prev_tricks=None):
+    '''Returns the list of cards in hand that may be played, in hand
+    order, given the 'PlayerData' state of the game advanced to the
+    current trick. Defaults to the hand and current trick stored in the
+    state by the latest call to 'play'. Given 'prev_tricks', advances
+    the state to them first, raising ValueError if it is past them or
+    belongs to another game.'''
+    if prev_tricks is not None:
+        if not state.matches(prev_tricks, state.deck):
+            raise ValueError('state does not match prev_tricks')
+        state.advance(prev_tricks)
+    hand = state['hand'] if hand is None else hand
+    curr = (state['curr'] or ()) if curr_trick is None else curr_trick
+    mask = legal_mask(card_mask(hand), not curr, state.tricks > 2, state.broken(curr))
+    return([card for card in hand if mask >> CARD_ID[card] & 1])
+
+
+def follow_suit(cards, curr_trick):
+    '''Returns the cards of a list in the lead suit of 'curr_trick', or
+    all of them if the player leads or holds none. Players picking from
+    'legal_moves' follow suit through this as 'Data' does, so the voids
+    inferred by 'PlayerData' hold for them.'''
+    if not curr_trick:
+        return(list(cards))
+    lead = SUIT[CARD_ID[curr_trick[0]]]
+    return([card for card in cards if SUIT[CARD_ID[card]] == lead] or list(cards))
+
+
+class Data():
+    '''Class pertaining to everything related to a given round in the
+    game, to be used and passed on as player_data subsequently. If not
+    specifying the trump and lead, class calculates data relating to the
+    start of a trick. Else, class determines valid cards to be played'''
+
+    def __init__(self, hand, curr=False, prev=False, deck=False, trump=False, lead=False, index=False, state=None):
+        '''Accepts a 'hand', optionally arguments for 'curr_trick',
+        'prev_tricks', 'deck_top', trump, lead and index of round, and
+        the 'player_data' of the previous call.'''
+        probe = instrument.PROBE
+        if probe:
+            probe.count('Data')
+            mark = probe.clock()
+        cards = HandMask(hand)
+
+        # Case where index is specified. (Determining
+        # specific sets of cards to play).
+        if index:
+            # Initialises index, trump and lead (Index
+            # passed as 1 higher to avoid 0 being False).
+            self.index = index - 1
+            self.trump = trump
+            self.lead = lead
+
+            # Filters hand for cards pertaining to trumps,
+            # leads, hearts and the remainder.
+            trump = SUIT_MASK[SUITS.index(trump)] if trump else 0
+            lead = SUIT_MASK[SUITS.index(lead)] if lead else 0
+            self.trumps = HandMask(cards.mask & trump)
+            self.leads = HandMask(cards.mask & lead)
+            self.hearts = cards.hearts
+            self.others = HandMask(cards.mask & ~(trump | lead))
+
+            # Cases regarding the 3 preliminary rounds.
+            if self.index <= 3:
+                # Initialises the highest and lowest trumps, only
+                # used in the preliminary rounds.
+                self.bigTrumps = self.trumps.highest
+                self.smallTrumps = self.trumps.lowest
+
+            # Initialises the highest and lowest card corresponding
+            # to their specified suits.
+            self.bigLeads = self.leads.highest
+            self.smallLeads = self.leads.lowest
+            self.bigHearts = self.hearts.highest
+            self.smallHearts = self.hearts.lowest
+            self.bigOthers = self.others.highest
+            self.smallOthers = self.others.lowest
+
+        # Case where trump and lead is not specified (Data
+        # regarding initial state of round).
+        else:
+            # Reuses the state of the previous call when it belongs to
+            # the same game, applying only the newly completed tricks.
+            tricks = prev or []
+            state = PlayerData.resume(tricks, deck, state)
+            if probe:
+                mark = probe.lap('history', mark)
+
+            # Determines round ID and card to be won in 'deck_top'.
+            self.index = state.tricks + 1
+            self.prize = deck[self.index - 1] if deck and self.index <= 3 else False
+
+            # Initialises trump and lead, and checks whether
+            # the player is leading the trick.
+            self.trump = state.trump
+            self.lead = Card(curr[0]).suit if curr else False
+            self.isLead = Trick(curr).isLead if curr else False
+
+            # Determines hand for possibility of shooting the moon.
+            self.tryShoot = cards.hearts.count > 4 and cards.hasQueenSpades
+
+            # Checks if hearts are broken, as 'is_broken_hearts' would
+            # for the whole history, and narrows the legal moves to the
+            # valid cards to be played, following the lead suit if
+            # possible and otherwise avoiding Hearts.
+            # Note : Falls back to the whole hand if no move is legal.
+            self.brokenHearts = bool(curr) and state.broken(curr)
+            legal = legal_mask(cards.mask, not curr, state.tricks > 2, state.broken(curr or ())) or cards.mask
+            lead = SUIT_MASK[SUITS.index(self.lead)] if self.lead else 0
+            valid = legal & lead or legal & ~HEARTS_MASK or legal
+            self.validPlay = hand if valid == cards.mask else [card for card in hand if valid >> CARD_ID[card] & 1]
+            if probe:
+                mark = probe.lap('validPlay', mark)
+
+            # Counter for each suit respectively in the hand, the
+            # current trick, the overturned cards and the previous tricks.
+            # Note : The previous tricks used to add nothing, as their
+            # cards were matched against suit letters as tuples.
+            counts = [sum(count) for count in zip(cards.counts(), HandMask(curr or ()).counts(), HandMask(deck or ()).counts(), state.played)]
+            self.countClubs, self.countDiamonds, self.countHearts, self.countSpades = counts
+            if probe:
+                probe.lap('suitCounts', mark)
+
+            # Updates data dictionary to be passed as 'player_data'.
+            state.clear()
+            state.update({'hand': hand, 'curr': curr, 'prev': prev, 'deck': deck, 'index': self.index, 'prize': self.prize, 'trump': self.trump, 'lead': self.lead, 'isLead': self.isLead, 'tryShoot': self.tryShoot, 'brokenHearts': self.brokenHearts, 'validPlay': self.validPlay, 'countDiamonds': self.countDiamonds, 'countClubs': self.countClubs, 'countHearts': self.countHearts, 'countSpades': self.countSpades})
+            self.data = state
+
+
+# Default strategy, mapping each decision leaf to the selectors tried in
+# order until one returns a card. Leaves are named by the round, whether
+# the player attempts shooting the moon, the prize in 'deck_top' or
+# whether hearts are broken, and how the player joins the trick.
+STRATEGY = {
+    # Prioritises winning the overturned Heart.
+    'preliminary round / shooting / hearts prize / leading': ['bigTrumps', 'bigOthers'],
+    'preliminary round / shooting / hearts prize / following': ['bigTrumps', 'bigLeads', 'bigOthers'],
+
+    # Prioritises losing for higher chance of winning later.
+    'preliminary round / shooting / other prize / leading': ['smallOthers', 'smallTrumps'],
+    'preliminary round / shooting / other prize / following': ['smallOthers', 'smallLeads', 'smallTrumps'],
+
+    # Prioritises not winning the overturned Heart.
+    'preliminary round / not shooting / hearts prize / leading': ['smallOthers', 'smallTrumps'],
+    'preliminary round / not shooting / hearts prize / following': ['smallOthers', 'smallLeads', 'smallTrumps'],
+
+    # Prioritises winning for higher chance of losing later.
+    'preliminary round / not shooting / other prize / leading': ['bigTrumps', 'bigOthers'],
+    'preliminary round / not shooting / other prize / following': ['bigTrumps', 'bigLeads', 'bigOthers'],
+
+    # Prioritises winning to obtain points.
+    'scoring round / shooting / brokenHearts / leading': ['bigHearts', 'bigOthers'],
+    'scoring round / shooting / brokenHearts / following': ['bigHearts', 'bigOthers'],
+    'scoring round / shooting / brokenHearts / following with hearts': ['bigHearts', 'bigOthers'],
+
+    # Prioritises breaking Hearts and winning.
+    'scoring round / shooting / not brokenHearts / leading': ['bigHearts', 'bigOthers'],
+    'scoring round / shooting / not brokenHearts / following': ['bigHearts', 'bigOthers'],
+    'scoring round / shooting / not brokenHearts / following with hearts': ['bigHearts', 'bigOthers'],
+
+    # Prioritises losing to avoid points.
+    'scoring round / not shooting / brokenHearts / leading': ['smallHearts', 'smallOthers'],
+    'scoring round / not shooting / brokenHearts / following': ['bigHearts', 'bigLeads', 'bigOthers'],
+    'scoring round / not shooting / brokenHearts / following with hearts': ['smallHearts', 'smallLeads', 'smallOthers'],
+
+    # Prioritises losing and getting rid of Hearts.
+    'scoring round / not shooting / not brokenHearts / leading': ['smallHearts', 'smallOthers'],
+    'scoring round / not shooting / not brokenHearts / following': ['bigHearts', 'bigLeads', 'bigOthers'],
+    'scoring round / not shooting / not brokenHearts / following with hearts': ['smallHearts', 'smallLeads', 'smallOthers'],
+}
+
+# Selectors by name, as the part of the hand partition they read from
+# and whether they pick its highest or lowest card.
+SELECTORS = {
+    'bigTrumps': (0, highest_card), 'smallTrumps': (0, lowest_card),
+    'bigLeads': (1, highest_card), 'smallLeads': (1, lowest_card),
+    'bigHearts': (2, highest_card), 'smallHearts': (2, lowest_card),
+    'bigOthers': (3, highest_card), 'smallOthers': (3, lowest_card),
+}
+
+
+class Strategy():
+    '''Class of a strategy table compiled for use by the 'Play' class.'''
+
+    def __init__(self, table=STRATEGY):
+        '''Accepts a dictionary mapping every leaf of 'STRATEGY' to a list
+        of selector names.'''
+        # Checks the table covers every leaf with known selectors.
+        missing = set(STRATEGY) - set(table)
+        if missing:
+            raise ValueError('strategy is missing leaves: %s' % ', '.join(sorted(missing)))
+        for leaf, selectors in table.items():
+            if leaf not in STRATEGY:
+                raise ValueError('unknown strategy leaf: %r' % leaf)
+            for selector in selectors:
+                if selector not in SELECTORS:
+                    raise ValueError('unknown selector %r in leaf %r' % (selector, leaf))
+
+        # Compiles leaves into tuples of (part, pick) selectors.
+        self.table = {leaf: tuple(SELECTORS[selector] for selector in selectors) for leaf, selectors in table.items()}
+
+        # Checksum of the selectors of the preliminary leaves, matched
+        # against that of the opening table before it is used.
+        preliminary = sorted((leaf, list(selectors)) for leaf, selectors in table.items() if leaf.startswith('preliminary round'))
+        self.preliminaryDigest = zlib.crc32(repr(preliminary).encode())
+
+    @classmethod
+    def load(cls, path):
+        '''Returns a strategy compiled from a JSON file in the format of
+        'STRATEGY'.'''
+        import json
+        with open(path) as f:
+            return(cls(json.load(f)))
+
+    def leaf(self, data):
+        '''Returns the name of the leaf deciding a play for the given
+        'player_data'.'''
+        # 3 preliminary rounds, keyed on the overturned card.
+        if data['index'] <= 3:
+            return('preliminary round / ' + ('shooting' if data['tryShoot'] else 'not shooting') + (' / hearts prize' if IS_HEARTS[CARD_ID[data['prize']]] else ' / other prize') + (' / leading' if data['isLead'] else ' / following'))
+
+        # 10 scoring rounds, keyed on broken hearts and the trick.
+        return('scoring round / ' + ('shooting' if data['tryShoot'] else 'not shooting') + (' / brokenHearts' if data['brokenHearts'] else ' / not brokenHearts') + (' / leading' if data['isLead'] else ' / following with hearts' if Trick(data['curr']).hasHearts else ' / following'))
+
+    def choose(self, data, leaf):
+        '''Returns the card picked by the selectors of a leaf, or False
+        if none of them apply.'''
+        # Partitions the valid plays once into trumps, leads, hearts and
+        # the remainder.
+        valid = card_mask(data['validPlay'])
+        trump = SUIT_MASK[SUITS.index(data['trump'])] if data['trump'] else 0
+        lead = SUIT_MASK[SUITS.index(data['lead'])] if data['lead'] else 0
+        parts = (valid & trump, valid & lead, valid & HEARTS_MASK, valid & ~(trump | lead))
+
+        # Tries each selector in order of preference.
+        for part, pick in self.table[leaf]:
+            if parts[part]:
+                return(pick(parts[part]))
+        return(False)
+
+
+class Play():
+    '''Class pertaining to the strategy used in the 'play' function.'''
+
+    def __init__(self, data, strategy=None):
+        '''Accepts a dictionary returned by 'player_data' every round,
+        and optionally a 'Strategy' to play by.'''
+        strategy = strategy or DEFAULT_STRATEGY
+
+        # More than one valid card to be played.
+        if len(data['validPlay']) > 1:
+            self.leaf = strategy.leaf(data)
+            self.play = strategy.choose(data, self.leaf)
+
+            # Safety measure in the event no selector applies.
+            if not self.play:
+                self.play = data['validPlay'][0]
+
+        # Only one valid card playable.
+        else:
+            self.leaf = None
+            self.play = data['validPlay'][0]
+
+
+# Compiled default strategy used when 'play' is not given one.
+DEFAULT_STRATEGY = Strategy()
+
+
+def is_broken_hearts(prev_tricks, curr_trick=()):
+    '''Returns True if hearts have been broken in the 10 scoring rounds
+    of the game, and False otherwise.'''
+    # Checks for presence of Hearts in both 'prev_tricks' (after the
+    # third round) and 'curr_trick' if specified.
+    # Note : Once a scoring round has been completed, any card in
+    # 'curr_trick' counts as hearts having been broken.
+    rounds = Trick(prev_tricks).Rounds10
+    return(any(IS_HEARTS[CARD_ID[card]] for card_list in rounds for card in card_list) or (len(rounds) > 0 and len(curr_trick) > 0))
+
+
+def is_valid_play(play, curr_trick, hand, prev_tricks, broken=is_broken_hearts, state=None):
+    '''Returns True if play is valid, and False otherwise. Given the
+    'PlayerData' state of the game, checks against 'legal_moves' without
+    going over 'prev_tricks' again, unless the state is past them or
+    belongs to another game, in which case it is not used.'''
+    # Returns False if one of the three invalid conditions are met:
+    # 1 : Card in 'play' is not in 'hand'.
+    # 2 : Played a Heart when 'hand' does not consist of all Hearts,
+    # hearts have not been broken, game is in the 10 scoring rounds,
+    # and player is the leading the trick.
+    # 3 : Played a Heart when hearts have not been broken, game is in
+    # the 10 scoring rounds, and player is not leading the trick.
+    # Note : Only checks whether hearts are broken for a Heart played
+    # in the scoring rounds, as other cards are legal regardless.
+    if play not in hand:
+        return(False)
+    if state is not None and state.matches(prev_tricks, state.deck):
+        return(play in legal_moves(state, hand, curr_trick, prev_tricks))
+    scoring = len(prev_tricks) > 2
+    hearts = not (scoring and IS_HEARTS[CARD_ID[play]]) or broken(prev_tricks, curr_trick)
+    return(bool(legal_mask(card_mask(hand), len(curr_trick) == 0, scoring, hearts) >> CARD_ID[play] & 1))
+
+
+def score_game(tricks, deck_top):
+    '''Returns a 4-tuple of integers, representing the score for each
+    of the four players in a game.'''
+    # Negates the score of the 'chosen one' if thou has shot the moon,
+    # and returns the score of players in a particular game.
+    # Note : Calculation is handled by the 'Score' class above.
+    score = Score(tricks, deck_top)
+    return(tuple([-number for number in score.score]) if score.shoot else tuple(score.score))
+
+
+def score_games(games):
+    '''Returns a list of 4-tuples of scores, one for each of a list of
+    (tricks, deck_top) pairs of recorded games.'''
+    return([score_game(tricks, deck_top) for tricks, deck_top in games])
+
+
+# Cards left in hand at or below which 'play' solves the rest of the
+# scoring rounds exactly, with 0 leaving every move to the strategy.
+ENDGAME_CARDS = 0
+
+# Whether 'play' answers the preliminary rounds from the precomputed
+# table of the 'openings' module, for strategies whose preliminary leaves
+# match those the table was built from.
+OPENING_TABLE = True
+
+
+def play(curr_trick, hand, prev_tricks, deck_top, is_valid=is_valid_play, score=score_game, player_data=None, suppress_player_data=False, strategy=None, endgame=None):
+    '''Returns a single card which represents this player's next play,
+    and optionally a second argument containing an updated player_data'''
+    # Returns a card as a string if player_data is suppressed, else
+    # a 2-tuple containing the card and 'player_data'.
+    # Note : Strategy used is determined in the 'Play' class above.
+    # Note : 'player_data' is handled by the 'Data' and 'PlayerData'
+    # classes above, and is updated in place when passed back in.
+    # Note : The endgame solver is imported on first use, as it
+    # depends on this module.
+    # Note : Phases are timed when enabled by the 'instrument' module.
+    # Note : The opening table is loaded on first use, and answers the
+    # preliminary rounds without building 'player_data' if suppressed.
+    # Its leaves are only worked out for the probe.
+    probe = instrument.PROBE
+    if probe:
+        started = probe.clock()
+    card = None
+    if OPENING_TABLE and len(prev_tricks) < 3 and len(deck_top) > len(prev_tricks) and hand:
+        from .openings import opening_leaf, opening_play
+        card = opening_play(curr_trick, hand, prev_tricks, deck_top, strategy)
+        leaf = opening_leaf(curr_trick, hand, prev_tricks, deck_top, strategy) if card and probe else None
+        if card and suppress_player_data:
+            if probe:
+                probe.lap('decision', started)
+                probe.lap('total', started)
+                probe.flush(leaf)
+            return(card)
+
+    if probe:
+        mark = probe.clock()
+    data = Data(hand, curr=curr_trick, prev=prev_tricks, deck=deck_top, state=player_data).data
+    if probe:
+        mark = probe.lap('data', mark)
+
+    endgame = ENDGAME_CARDS if endgame is None else endgame
+    if len(hand) <= endgame and data['index'] > 3 and len(data['validPlay']) > 1:
+        from .endgame import solve_play
+        try:
+            card = solve_play(curr_trick, hand, prev_tricks, deck_top)
+            leaf = 'endgame'
+        except ValueError:
+            card = None
+
+    if not card:
+        decision = Play(data, strategy)
+        card, leaf = decision.play, decision.leaf
+    if probe:
+        probe.lap('decision', mark)
+        probe.lap('total', started)
+        probe.flush(leaf)
+    return(card if suppress_player_data else (card, data))
+
+
+# Weights of the model trained by the 'predictor' module, read on first
+# use by 'predict_score', or False if they cannot be read.
+PREDICTOR_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'predictor.json')
+PREDICTOR = None
+
+
+def load_predictor(path=PREDICTOR_PATH):
+    '''Returns the weights of a trained model for 'predict_score', as the
+    weight of each card id and those of each void, singleton, a hand of
+    only Hearts, trying to shoot the moon, an unguarded Queen of Spades,
+    and the bias.'''
+    import json
+    with open(path) as f:
+        named = json.load(f)['weights']
+
+    # Features counting cards held are summed into the weight of each
+    # card, leaving those depending on the whole hand.
+    cards = tuple(
+        named['card ' + DECK[card]] + named['count' + ('Clubs', 'Diamonds', 'Hearts', 'Spades')[SUIT[card]]] + named['cards']
+        + (named['highHearts'] if IS_HEARTS[card] and RANK[card] > 7 else 0.0) + (named['hasQueenSpades'] if IS_QUEEN_SPADES[card] else 0.0)
+        for card in range(52)
+    )
+    voids = tuple(named['void ' + suit] for suit in SUITS)
+    singletons = tuple(named['singleton ' + suit] for suit in SUITS)
+    return(cards, voids, singletons, named['allHearts'], named['tryShoot'], named['unguardedQueenSpades'], named['bias'])
+
+
+def predict_score(hand):
+    '''Returns an integer prediction of this player's score on
+    completion of the game based on the scoring system.'''
+    global PREDICTOR
+    if PREDICTOR is None:
+        try:
+            PREDICTOR = load_predictor()
+        except (OSError, ValueError, KeyError):
+            PREDICTOR = False
+    ids = card_ids(hand)
+
+    # Predicts with the model trained on simulated games, rounding to
+    # the nearest point. Use 'predictor.predict_scores' for many hands.
+    if PREDICTOR:
+        cards, voids, singletons, allHearts, tryShoot, unguarded, score = PREDICTOR
+        lengths = [0, 0, 0, 0]
+        for card in ids:
+            score += cards[card]
+            lengths[SUIT[card]] += 1
+        for suit in range(4):
+            if lengths[suit] == 0:
+                score += voids[suit]
+            elif lengths[suit] == 1:
+                score += singletons[suit]
+        if ids and lengths[2] == len(ids):
+            score += allHearts
+        if QUEEN_SPADES in ids:
+            score += (tryShoot if lengths[2] > 4 else 0.0) + (unguarded if lengths[3] <= 2 else 0.0)
+        return(int(round(score)))
+
+    # Falls back to counting Hearts above 7 and the Queen of Spades.
+    # Note : May contain high inaccuracies.
+    points = sum(1 for card in ids if IS_HEARTS[card] and RANK[card] > 7) + (13 if any(IS_QUEEN_SPADES[card] for card in ids) else 0)
+    return(points if sum(1 for card in ids if IS_HEARTS[card] and IS_QUEEN_SPADES[card]) < 6 else -points)
+
+
+def get_winner_score(trick, round_id, deck_top):
+    '''Returns a 2-tuple containing the index of the winner of the trick
+    relative to player ordering and score for the current trick.'''
+    # For use when a 'random-game.py' file is bestowed upon us as to
+    # enable us to play against ourselves *inserts Forever Alone meme*
+    # while waiting for the announcement of the 'Grok Leaderboard'.
+    # Note : As with 'score_game', calculation handled by 'Player' class.
+    player = Player((0, 0, 0, 0), trick, deck_top, round_id - 1)
+    return(player.winner, player.score)
+
+def main():
+    is_broken_hearts([('JD', '6D', '0D', '9D')])
+    is_broken_hearts([('6S', '9S', '2S', '5S'), ('KH', '6H', '0H', '9H'), ('KD', '6D', '0D', 'AD'), ('JD', '2D', '3D', 'QD'), ('7D', 'AH', '8D', '3S'), ('4S', 'JS', 'QS', '0S'), ('KC', 'AC', '4C', '7C'), ('7S', 'JC', 'KS', '8S')], ())
+    is_valid_play('0D', (), ['0D', '9S', '3S', '3D', '3H', '5D', 'AD', '6C', '7D', '6H'], [])
+    is_valid_play('KS', (), ['0D', '9S', '3S', '3D', '3H', '5D', 'AD', '6C', '7D', '6H', 'JH'], [])
+    score_game([('AH', '2H', '9H', 'JH'), ('KS', '2S', 'AS', 'QS')], ['9S', '0H', '7D'])
+    score_game([('3S', '0S', '8S', 'JS'), ('9H', 'QH', '0D', '5H'), ('AD', '8D', '2D', '3D'), ('4S', 'QS', '9S', '2S')], ['5D', '2S', '7S'])
+    play(['8C'], ['KH', '7C', '2S', '6S', 'JS', '0D', '8H', '3S'], [('AC', '3C', '0C', '6C'), ('KD', '8D', '5D', '4D'), ('JH', '0H', '5H', '2H'), ('AS', 'KS', 'QS', '9S'), ('3D', '9D', 'JD', '7D')], ['JH', 'AS', '7S'], suppress_player_data=True)
+    predict_score(['0D', '9S', '3S', '3D', '3H', '5D', 'AD', '6C', '7D', '6H'])
+    predict_score(['0D', '9S', '3S', '3D', '3H', '5D', 'AD', '6C', '7D', '6H', 'JH'])
+    predict_score(['7C', '4H'])
+    predict_score(['0D', '9S', '3S', '3D', '3H', '5D', 'AD', '6C', '7D', 'JH'])
+    predict_score(['JH', '3S', '2H', '9H', 'JS', '5C', '8H', 'KD', 'AD', '7H'])
+    predict_score(['JS', '6H', '3D', 'QS', '6C', '4H', '9H', 'AS', 'QC', '0D'])
+    predict_score(['6S', '5C', '7C', '5D', 'JD', '7D', '4D', '2C', 'QS', '9C'])
+    predict_score(['8D', '6S', '8S', '5H', '0C', '7D', '3D', 'KC', '4C'])
+    predict_score(['JH', '3H', '2H', '9H', '5H', '7H', '8H', '0H', 'QH', 'KH'])
+    predict_score(['KH', '7C', '2S', '6S', 'JS', '0D', '8H', '3S'])
+    predict_score(['7S', '5C', '9S', '7C', '4C', '7D', '6S', '3H', '9D', '0S'])
+    predict_score(['KH', '3H', '6H', '2H', 'AH', '2S'])
+    predict_score(['QD', 'JS', '7H', 'AS', 'AH', '4C', '8H', '3D', 'KD', 'QS'])
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,205 @@
+import random
+from collections import OrderedDict
+
+from .core import CARD_ID, DECK, HEARTS_MASK, IS_HEARTS, LANE, POINTS, SUIT, SUIT_MASK, QUEEN_SPADES_MASK, PlayerData, Score, card_mask, follow_suit, legal_moves
+from .search import Knowledge
+
+# Bounds stored with solved values, as alpha-beta may only prove a
+# position is at least or at most a value.
+EXACT, LOWER, UPPER = 0, 1, 2
+
+
+class TranspositionTable():
+    '''Class of a bounded cache of solved positions, evicting the least
+    recently used entry when full, with counters for sizing it.'''
+
+    def __init__(self, size=200000):
+        '''Accepts the maximum number of positions to keep.'''
+        self.size = size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        '''Returns the (value, bound) stored for a key, or None.'''
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return(None)
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return(entry)
+
+    def put(self, key, value, bound):
+        '''Stores the value of a position, evicting if full.'''
+        self.entries[key] = (value, bound)
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.size:
+            self.entries.popitem(last=False)
+
+    def stats(self):
+        '''Returns a dictionary of the hit and miss counters.'''
+        lookups = self.hits + self.misses
+        return({'hits': self.hits, 'misses': self.misses, 'hitRate': self.hits / lookups if lookups else 0.0, 'entries': len(self.entries), 'size': self.size})
+
+
+def moves(hand, lead, broken):
+    '''Returns a mask of the cards a hand may play, following the lead
+    suit if possible, and only leading Hearts once broken or if the hand
+    holds nothing else.'''
+    if lead is not None:
+        return(hand & SUIT_MASK[lead] or hand)
+    return(hand if broken else hand & ~HEARTS_MASK or hand)
+
+
+def compress(hands):
+    '''Returns a canonical encoding of the remaining hands, in which
+    the cards of each suit are renumbered by their order among the cards
+    left, along with the position of the Queen of Spades.'''
+    remaining = hands[0] | hands[1] | hands[2] | hands[3]
+    encoded = [0, 0, 0, 0]
+    queen = -1
+    for suit in range(4):
+        lane = remaining >> (13 * suit) & LANE
+        shift = 13 * suit
+        while lane:
+            low = lane & -lane
+            lane ^= low
+            bit = low << (13 * suit)
+            for seat in range(4):
+                if hands[seat] & bit:
+                    encoded[seat] |= 1 << shift
+            if bit == QUEEN_SPADES_MASK:
+                queen = shift
+            shift += 1
+    return(tuple(encoded), queen)
+
+
+class Solver():
+    '''Class of an exact solver for the last scoring tricks when every
+    hand is known. The solver plays to minimise the final score of one
+    player, assuming the other three play to maximise it.'''
+
+    def __init__(self, table=None):
+        '''Accepts a 'TranspositionTable' to share between solves.'''
+        self.table = table if table is not None else TranspositionTable()
+
+    def evaluate(self, hands, leader, curr, me, broken, taken, others):
+        '''Returns a dictionary of the exact final score of 'me' after
+        each card it may play, given the hand masks of each seat, the
+        seat leading the current trick, the card ids played in it,
+        whether Hearts are broken, the points 'me' has taken so far and
+        whether any other player has taken points.'''
+        # Rotates seats so that 'me' is seat 0 in the solver.
+        hands = [hands[(me + seat) % 4] for seat in range(4)]
+        leader = (leader - me) % 4
+        lead = SUIT[curr[0]] if curr else None
+        options = moves(hands[0], lead, broken)
+
+        values = {}
+        option = options
+        while option:
+            low = option & -option
+            card = low.bit_length() - 1
+            after = list(hands)
+            after[0] ^= low
+            values[card] = self.value(after, leader, curr + [card], broken, taken, others, -1000, 1000)
+            option ^= low
+        return(values)
+
+    def value(self, hands, leader, curr, broken, taken, others, alpha, beta):
+        '''Returns the final score of seat 0 under alpha-beta search.'''
+        # Resolves a complete trick, crediting its points to the winner.
+        if len(curr) == 4:
+            suit = SUIT[curr[0]]
+            winner = max(range(4), key=lambda position: curr[position] if SUIT[curr[position]] == suit else -1)
+            points = POINTS[curr[0]] + POINTS[curr[1]] + POINTS[curr[2]] + POINTS[curr[3]]
+            leader = (leader + winner) % 4
+            if leader == 0:
+                taken += points
+            elif points:
+                others = True
+            broken = broken or any(IS_HEARTS[card] for card in curr)
+            curr = []
+
+        # Scores the game once every card has been played, negating the
+        # score if seat 0 has taken every point.
+        if not curr and not (hands[0] | hands[1] | hands[2] | hands[3]):
+            return(-taken if taken and not others else taken)
+
+        # Looks up positions at the start of a trick.
+        key = None
+        if not curr:
+            encoded, queen = compress(hands)
+            key = (encoded, queen, leader, broken, taken, others)
+            entry = self.table.get(key)
+            if entry is not None:
+                stored, bound = entry
+                if bound == EXACT or bound == LOWER and stored >= beta or bound == UPPER and stored <= alpha:
+                    return(stored)
+        low, high = alpha, beta
+
+        # Seat 0 minimises its score and the other seats maximise it.
+        seat = (leader + len(curr)) % 4
+        options = moves(hands[seat], SUIT[curr[0]] if curr else None, broken)
+        best = 1000 if seat == 0 else -1000
+        while options:
+            bit = options & -options
+            options ^= bit
+            after = list(hands)
+            after[seat] ^= bit
+            result = self.value(after, leader, curr + [bit.bit_length() - 1], broken, taken, others, alpha, beta)
+            if seat == 0:
+                best = min(best, result)
+                beta = min(beta, best)
+            else:
+                best = max(best, result)
+                alpha = max(alpha, best)
+            if alpha >= beta:
+                break
+
+        if key is not None:
+            self.table.put(key, best, UPPER if best <= low else LOWER if best >= high else EXACT)
+        return(best)
+
+
+# Solver shared by calls to 'play', so its table persists between moves.
+SOLVER = Solver()
+
+
+def solve_play(curr_trick, hand, prev_tricks, deck_top, deals=16, seed=0, solver=None):
+    '''Returns the card with the best mean exact score over deals of the
+    unseen cards, for a player in the scoring rounds. Raises ValueError
+    if the state is not consistent with a dealt game.'''
+    solver = solver or SOLVER
+    state = PlayerData.resume(prev_tricks, deck_top)
+    knowledge = Knowledge(curr_trick, hand, prev_tricks, deck_top, state)
+    if len(prev_tricks) < 3:
+        raise ValueError('the endgame solver only plays the scoring rounds')
+
+    # Points taken so far, and whether Hearts have been broken.
+    score = Score(prev_tricks, deck_top).score
+    taken = score[knowledge.seat]
+    others = any(score[seat] for seat in range(4) if seat != knowledge.seat)
+    broken = state.heartsBroken
+    curr = [CARD_ID[card] for card in curr_trick]
+
+    # Counts each distinct deal, as they repeat once few cards are left.
+    rng = random.Random('%s:%d:%s' % (seed, len(prev_tricks), ''.join(hand)))
+    counts = {}
+    for deal in range(deals):
+        hands = tuple(card_mask(cards) for cards in knowledge.sample(rng)[0])
+        counts[hands] = counts.get(hands, 0) + 1
+
+    # Sums the exact score of each card over the deals.
+    totals = {}
+    for hands, count in counts.items():
+        for card, value in solver.evaluate(list(hands), knowledge.leader, curr, knowledge.seat, broken, taken, others).items():
+            totals[card] = totals.get(card, 0) + value * count
+
+    # Prefers cards the referee accepts that follow suit, as the solver
+    # assumes of every seat, and among those the lowest score.
+    allowed = follow_suit(legal_moves(state, hand, curr_trick), curr_trick)
+    legal = [card for card in totals if DECK[card] in allowed] or list(totals)
+    return(DECK[min(legal, key=lambda card: (totals[card], card))])
+
@@ -0,0 +1,121 @@
+import random
+
+from .core import DECK, get_winner_score, is_valid_play, score_game
+
+
+class Game():
+    '''Class of a single game between four agents, played out in full
+    when constructed. Agents are callables accepting the arguments of
+    'play', returning either a card or a 2-tuple of the card and
+    'player_data' as 'play' does.'''
+
+    def __init__(self, agents, seed=None, is_valid=is_valid_play):
+        '''Accepts a list of four agents by seat, an optional seed for
+        the deal and a function to validate plays with.'''
+        # Deals 10 cards to each player. Of the 12 cards left, 3 are
+        # overturned as 'deck_top' and 9 are drawn face down.
+        rng = random.Random(seed)
+        deck = list(DECK)
+        rng.shuffle(deck)
+        self.deal = [deck[10 * seat:10 * seat + 10] for seat in range(4)]
+        self.deck_top = deck[40:43]
+        self.draws = deck[43:]
+        self.stock = list(self.draws)
+
+        # Hands held, tricks played and the current trick, with seat 0
+        # leading the first trick.
+        self.hands = [list(hand) for hand in self.deal]
+        self.tricks = []
+        self.curr = []
+        self.leader = 0
+        self.run(agents, is_valid)
+
+    @classmethod
+    def resume(cls, agents, hands, stock, tricks, curr, leader, deck_top, is_valid=None):
+        '''Returns a game played out from a position part way through,
+        given the hands of each seat, the cards left to draw, the tricks
+        played, the current trick and the seat leading it. Plays are
+        not validated unless 'is_valid' is given.'''
+        self = cls.__new__(cls)
+        self.deal = None
+        self.deck_top = list(deck_top)
+        self.draws = list(stock)
+        self.stock = list(stock)
+        self.hands = [list(hand) for hand in hands]
+        self.tricks = list(tricks)
+        self.curr = list(curr)
+        self.leader = leader
+        self.run(agents, is_valid)
+        return(self)
+
+    def run(self, agents, is_valid):
+        '''Plays the remaining preliminary and scoring rounds, and scores
+        the game.'''
+        # Invalid plays and 'player_data' of each seat.
+        self.invalid = [0, 0, 0, 0]
+        self.data = [None, None, None, None]
+
+        while len(self.tricks) < 13:
+            index = len(self.tricks)
+            while len(self.curr) < 4:
+                seat = (self.leader + len(self.curr)) % 4
+                self.curr.append(self.move(agents[seat], seat, self.curr, is_valid))
+            winner = get_winner_score(tuple(self.curr), index + 1, self.deck_top)[0]
+            self.leader = (self.leader + winner) % 4
+            self.tricks.append(tuple(self.curr))
+            self.curr = []
+            take_prize(self.hands, self.stock, self.deck_top, index, self.leader)
+
+        self.scores = score_game(self.tricks, self.deck_top)
+
+    def move(self, agent, seat, curr, is_valid):
+        '''Returns the card played by the agent of a seat, removing it
+        from their hand. Invalid plays are counted and replaced by the
+        first valid card in hand, if there is one.'''
+        hand = self.hands[seat]
+        result = agent(list(curr), list(hand), self.tricks, self.deck_top, player_data=self.data[seat])
+        if type(result) == tuple:
+            card, self.data[seat] = result
+        else:
+            card = result
+
+        if is_valid and not is_valid(card, tuple(curr), hand, self.tricks):
+            self.invalid[seat] += 1
+            card = next((option for option in hand if is_valid(option, tuple(curr), hand, self.tricks)), card if card in hand else hand[0])
+        hand.remove(card)
+        return(card)
+
+
+def take_prize(hands, stock, deck_top, index, winner):
+    '''Deals out the cards taken after the trick of a 0-based round ID
+    won by a seat, removing those drawn from 'stock'.'''
+    # Winner of a preliminary round takes the overturned card,
+    # and the other players draw one face down in turn.
+    if index < 3:
+        hands[winner].append(deck_top[index])
+        for offset in range(1, 4):
+            hands[(winner + offset) % 4].append(stock.pop(0))
+
+
+def replay(deal, deck_top, draws, tricks):
+    '''Yields (index, leader, hands) at the start of each trick of a
+    game played from a deal, with the 0-based round ID, the seat leading
+    the trick and the hand of each seat. The hands are updated in place
+    once the next item is requested, so should be copied to be kept.
+    Cards played but not held are skipped.'''
+    hands = [list(hand) for hand in deal]
+    stock = list(draws)
+    leader = 0
+    for index, trick in enumerate(tricks):
+        yield(index, leader, hands)
+        for position, card in enumerate(trick):
+            hand = hands[(leader + position) % 4]
+            if card in hand:
+                hand.remove(card)
+        leader = (leader + get_winner_score(tuple(trick), index + 1, deck_top)[0]) % 4
+        take_prize(hands, stock, deck_top, index, leader)
+
+
+def play_game(agents, seed=None):
+    '''Returns a 4-tuple of scores for a game between four agents.'''
+    return(Game(agents, seed).scores)
@@ -0,0 +1,107 @@
+import time
+
+# Probe collecting measurements, or None while instrumentation is off.
+# Instrumented code only checks this before doing any work.
+PROBE = None
+
+
+class Probe():
+    '''Class collecting the phase timings and object counts of one call
+    to 'play' at a time, passing each finished record to a sink. Sinks
+    are callables accepting a record dictionary.'''
+
+    def __init__(self, sink):
+        self.sink = sink
+        self.timings = {}
+        self.counts = {}
+        self.clock = time.perf_counter
+
+    def lap(self, phase, started):
+        '''Adds the time since 'started' to a phase, and returns the
+        current time to time the next phase from.'''
+        now = self.clock()
+        self.timings[phase] = self.timings.get(phase, 0.0) + now - started
+        return(now)
+
+    def count(self, name):
+        '''Adds one to a counter, such as objects of a class built.'''
+        self.counts[name] = self.counts.get(name, 0) + 1
+
+    def flush(self, leaf):
+        '''Passes the record of the finished call to the sink, naming the
+        strategy leaf that decided it, and starts a new record.'''
+        record = {'leaf': leaf, 'timings': self.timings, 'counts': self.counts}
+        self.timings = {}
+        self.counts = {}
+        self.sink(record)
+
+
+class Histogram():
+    '''Class of a sink keeping in-memory histograms of phase timings,
+    overall and for each strategy leaf, with buckets by powers of two
+    microseconds, and totals of every counter.'''
+
+    def __init__(self):
+        self.histograms = {}
+        self.counts = {}
+        self.leaves = {}
+
+    def __call__(self, record):
+        leaf = record['leaf']
+        self.leaves[leaf] = self.leaves.get(leaf, 0) + 1
+        for phase, seconds in record['timings'].items():
+            self.add(phase, seconds)
+            if phase == 'decision' and leaf:
+                self.add('decision / ' + leaf, seconds)
+        for name, count in record['counts'].items():
+            self.counts[name] = self.counts.get(name, 0) + count
+
+    def add(self, metric, seconds):
+        '''Adds a timing in seconds to the histogram of a metric.'''
+        histogram = self.histograms.setdefault(metric, {'count': 0, 'seconds': 0.0, 'buckets': {}})
+        histogram['count'] += 1
+        histogram['seconds'] += seconds
+        bucket = max(0, int(seconds * 1e6)).bit_length()
+        histogram['buckets'][bucket] = histogram['buckets'].get(bucket, 0) + 1
+
+    def percentile(self, metric, fraction):
+        '''Returns the upper bound in microseconds of the bucket holding
+        a percentile of a metric.'''
+        histogram = self.histograms[metric]
+        seen = 0
+        for bucket in sorted(histogram['buckets']):
+            seen += histogram['buckets'][bucket]
+            if seen >= fraction * histogram['count']:
+                return(float(1 << bucket))
+
+    def summary(self):
+        '''Returns a dictionary of the count, mean, p50 and p99 in
+        microseconds of each metric, with counter and leaf totals.'''
+        metrics = {metric: {'count': histogram['count'], 'mean': histogram['seconds'] / histogram['count'] * 1e6, 'p50': self.percentile(metric, 0.5), 'p99': self.percentile(metric, 0.99)} for metric, histogram in self.histograms.items()}
+        return({'metrics': metrics, 'counts': dict(self.counts), 'leaves': {str(leaf): count for leaf, count in self.leaves.items()}})
+
+
+class JsonLines():
+    '''Class of a sink writing each record as a line of JSON to a file.'''
+
+    def __init__(self, f):
+        '''Accepts a file opened for writing text.'''
+        self.file = f
+
+    def __call__(self, record):
+        import json
+        self.file.write(json.dumps(record, sort_keys=True) + '\n')
+
+
+def enable(sink):
+    '''Turns instrumentation on, sending records to a sink, which may be
+    any callable accepting a record. Returns the new 'Probe'.'''
+    global PROBE
+    PROBE = Probe(sink)
+    return(PROBE)
+
+
+def disable():
+    '''Turns instrumentation off.'''
+    global PROBE
+    PROBE = None
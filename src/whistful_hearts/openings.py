@@ -0,0 +1,167 @@
+import argparse
+import os
+import zlib
+
+from . import core
+from .core import CARD_ID, DECK, HEARTS_MASK, IS_HEARTS, LANE, QUEEN_SPADES_MASK, SUIT, SUIT_MASK, SUITS, Play, card_mask, popcount
+
+# Bundled table, read on first use by 'opening_play'. Files start with
+# the magic bytes and the 'preliminaryDigest' of the strategy the table
+# was built from, as 4 big-endian bytes.
+TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'openings.bin')
+MAGIC = b'WHOT2'
+TABLE = None
+DIGEST = None
+
+# The preliminary leaves of the default strategy either pick the highest
+# card of the first part of the hand that has one, or the lowest, so a
+# state reduces to the one card of each suit of 'validPlay' they may
+# pick. Suits are reduced by isomorphism to slots, with the trump suit
+# first, then the lead suit if it is not trumps, then the rest in suit
+# order, which keeps ties between suits broken as 'Play' breaks them.
+# Keys number the direction, whether the lead suit is none, trumps or
+# another suit, and the rank plus one of each slot's card, 0 if empty.
+LEADING, LEAD_TRUMPS, LEAD_OTHER = 0, 1, 2
+SLOTS = 14 ** 4
+SIZE = 6 * SLOTS
+EMPTY = 255
+
+
+def slots(trump, lead):
+    '''Returns the suits in the order of the slots of a key, and whether
+    the lead suit is none, trumps or another suit.'''
+    if lead is None:
+        return([trump] + [suit for suit in range(4) if suit != trump], LEADING)
+    if lead == trump:
+        return([trump] + [suit for suit in range(4) if suit != trump], LEAD_TRUMPS)
+    return([trump, lead] + [suit for suit in range(4) if suit not in (trump, lead)], LEAD_OTHER)
+
+
+def encode(big, leading, ranks):
+    '''Returns the key of a state, given the direction, whether the lead
+    suit is none, trumps or another suit, and the rank plus one of each
+    slot's card.'''
+    return((2 * leading + big) * SLOTS + ranks[0] + 14 * ranks[1] + 196 * ranks[2] + 2744 * ranks[3])
+
+
+def valid_mask(hand, lead):
+    '''Returns the mask of the valid cards of a hand as 'Data' filters
+    them, and whether the player tries shooting the moon.'''
+    mask = card_mask(hand)
+    if lead is not None and mask & SUIT_MASK[lead]:
+        valid = mask & SUIT_MASK[lead]
+    elif mask & ~HEARTS_MASK:
+        valid = mask & ~HEARTS_MASK
+    else:
+        valid = mask
+    return(valid, popcount(mask & HEARTS_MASK) > 4 and bool(mask & QUEEN_SPADES_MASK))
+
+
+def opening_play(curr_trick, hand, prev_tricks, deck_top, strategy=None):
+    '''Returns the card 'Play' picks with a strategy, by default that of
+    'core', in one of the 3 preliminary rounds, with a single lookup in
+    the opening table. Returns None if there is no table, or if it was
+    built from a strategy with other preliminary leaves.'''
+    table = TABLE if TABLE is not None else load()
+    if not table or (strategy or core.DEFAULT_STRATEGY).preliminaryDigest != DIGEST:
+        return(None)
+    trump = SUIT[CARD_ID[deck_top[0]]]
+    lead = SUIT[CARD_ID[curr_trick[0]]] if curr_trick else None
+    valid, shoot = valid_mask(hand, lead)
+
+    # Picks high when 'tryShoot' matches whether the prize is a Heart.
+    big = shoot == IS_HEARTS[CARD_ID[deck_top[len(prev_tricks)]]]
+    order, leading = slots(trump, lead)
+    ranks = []
+    for suit in order:
+        lane = valid >> (13 * suit) & LANE
+        ranks.append(0 if not lane else lane.bit_length() if big else (lane & -lane).bit_length())
+
+    answer = table[encode(big, leading, ranks)]
+    return(DECK[13 * order[answer // 13] + answer % 13])
+
+
+def opening_leaf(curr_trick, hand, prev_tricks, deck_top, strategy=None):
+    '''Returns the leaf of a strategy deciding a play in one of the 3
+    preliminary rounds, or None if there is only one valid card, as
+    'Play' records it.'''
+    lead = SUIT[CARD_ID[curr_trick[0]]] if curr_trick else None
+    valid, shoot = valid_mask(hand, lead)
+    if popcount(valid) < 2:
+        return(None)
+
+    # Note : 'Data' only sets 'isLead' for a non-empty trick, so it is
+    # always False here.
+    data = {'index': len(prev_tricks) + 1, 'tryShoot': shoot, 'prize': deck_top[len(prev_tricks)], 'isLead': False}
+    return((strategy or core.DEFAULT_STRATEGY).leaf(data))
+
+
+def build(strategy=None):
+    '''Returns the opening table, running 'Play' with a strategy, by
+    default that of 'core', on a representative state of every key.
+    Raises ValueError if 'Play' picks a card the key does not capture.'''
+    table = bytearray([EMPTY]) * SIZE
+    for leading in (LEADING, LEAD_TRUMPS, LEAD_OTHER):
+        # Representative suits, with Clubs as trumps in slot 0 and each
+        # other slot holding the suit of the same index.
+        lead = (False, SUITS[0], SUITS[1])[leading]
+        for big in (False, True):
+            # Not shooting picks high for a prize that is not a Heart.
+            prize = '2C' if big else '2H'
+            for key in range(SLOTS):
+                ranks = [key % 14, key // 14 % 14, key // 196 % 14, key // 2744]
+
+                # Each slot holds its card and, as a decoy, the opposite
+                # extreme of the suit, which the key must not depend on.
+                valid = set()
+                for suit, rank in enumerate(ranks):
+                    if rank:
+                        valid.update((13 * suit + rank - 1, 13 * suit + (0 if big else 12)))
+                if not valid:
+                    continue
+
+                data = {'index': 1, 'prize': prize, 'trump': SUITS[0], 'lead': lead, 'isLead': False, 'tryShoot': False, 'curr': [], 'validPlay': [DECK[card] for card in sorted(valid)]}
+                card = CARD_ID[Play(data, strategy).play]
+                if ranks[SUIT[card]] != card % 13 + 1:
+                    raise ValueError('Play picked %s, which the key does not capture' % DECK[card])
+                table[encode(big, leading, ranks)] = card
+    return(bytes(table))
+
+
+def save(table, path=TABLE_PATH, strategy=None):
+    '''Writes a table built from a strategy, by default that of 'core',
+    compressed to a file.'''
+    digest = (strategy or core.DEFAULT_STRATEGY).preliminaryDigest
+    with open(path, 'wb') as f:
+        f.write(MAGIC + digest.to_bytes(4, 'big') + zlib.compress(table, 9))
+
+
+def load(path=TABLE_PATH):
+    '''Returns the table read from a file, keeping it and the digest of
+    its strategy for later calls, or an empty table if the file does not
+    exist.'''
+    global TABLE, DIGEST
+    try:
+        with open(path, 'rb') as f:
+            content = f.read()
+    except FileNotFoundError:
+        TABLE = b''
+        return(TABLE)
+    if not content.startswith(MAGIC):
+        raise ValueError('%s is not an opening table' % path)
+    DIGEST = int.from_bytes(content[len(MAGIC):len(MAGIC) + 4], 'big')
+    TABLE = zlib.decompress(content[len(MAGIC) + 4:])
+    return(TABLE)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Builds the opening table for the preliminary rounds.')
+    parser.add_argument('--output', default=TABLE_PATH)
+    parser.add_argument('--strategy', help='JSON file of the strategy to build for, instead of the default')
+    args = parser.parse_args()
+    strategy = core.Strategy.load(args.strategy) if args.strategy else None
+    save(build(strategy), args.output, strategy)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+import argparse
+import json
+
+import numpy as np
+
+from .core import DECK, IS_HEARTS, IS_QUEEN_SPADES, PREDICTOR_PATH, RANK, SUIT, SUITS, play
+from .engine import Game, replay
+from .records import card_ids
+
+# Bundled weights, read on first use by 'predict_scores', and by
+# 'predict_score' for single hands without NumPy.
+WEIGHTS_PATH = PREDICTOR_PATH
+WEIGHTS = None
+
+# Columns of the card indicator matrix selecting each suit, the Hearts
+# above 7 counted by 'predict_score', and the Queen of Spades.
+SUIT_COLUMNS = np.array([[SUIT[card] == suit for suit in range(4)] for card in range(52)], dtype=np.float64)
+HIGH_HEARTS = np.array([IS_HEARTS[card] and RANK[card] > 7 for card in range(52)], dtype=np.float64)
+QUEEN_SPADES = np.array(IS_QUEEN_SPADES, dtype=np.float64)
+COUNTS = ['countClubs', 'countDiamonds', 'countHearts', 'countSpades']
+
+# Names of the features, in the order of the columns of 'features'.
+FEATURES = (
+    ['card ' + card for card in DECK] + COUNTS
+    + ['void ' + suit for suit in SUITS] + ['singleton ' + suit for suit in SUITS]
+    + ['cards', 'highHearts', 'hasQueenSpades', 'allHearts', 'tryShoot', 'unguardedQueenSpades', 'bias']
+)
+
+
+def indicators(hands):
+    '''Returns an (N, 52) array with a 1 for each card held in each of a
+    list of hands of length 2 strings.'''
+    lengths = [len(hand) for hand in hands]
+    matrix = np.zeros((len(hands), 52), dtype=np.float64)
+    matrix[np.repeat(np.arange(len(hands)), lengths), card_ids(card for hand in hands for card in hand)] = 1.0
+    return(matrix)
+
+
+def features(hands):
+    '''Returns an (N, F) array of the features of a list of hands, named
+    by 'FEATURES': the cards held, the length of each suit, voids and
+    singletons, and the attributes of 'Hand' that bear on the score.'''
+    held = indicators(hands)
+    counts = held @ SUIT_COLUMNS
+    cards = counts.sum(axis=1, keepdims=True)
+    hearts = counts[:, 2:3]
+    queen = held @ QUEEN_SPADES[:, None]
+    columns = [
+        held, counts, (counts == 0).astype(np.float64), (counts == 1).astype(np.float64),
+        cards, held @ HIGH_HEARTS[:, None], queen, ((hearts == cards) & (cards > 0)).astype(np.float64),
+        ((hearts > 4) & (queen > 0)).astype(np.float64), queen * (counts[:, 3:4] <= 2), np.ones_like(cards),
+    ]
+    return(np.hstack(columns))
+
+
+def snapshots(game):
+    '''Returns the hand of each seat at the start of every trick of a
+    finished 'engine.Game', with the seat, as a list of (hand, seat).'''
+    result = []
+    for index, leader, hands in replay(game.deal, game.deck_top, game.draws, game.tricks):
+        result += [(list(hand), seat) for seat, hand in enumerate(hands)]
+    return(result)
+
+
+def simulate(games=2000, seed=0):
+    '''Returns the hands held at the start of every trick of seeded
+    self-play games, and the final score of the seat holding each.'''
+    hands = []
+    scores = []
+    for index in range(games):
+        game = Game([play] * 4, 'predictor:%s:%d' % (seed, index))
+        for hand, seat in snapshots(game):
+            hands.append(hand)
+            scores.append(game.scores[seat])
+    return(hands, np.array(scores, dtype=np.float64))
+
+
+def train(hands, scores, l2=1.0):
+    '''Returns weights fitted to predict scores from the features of
+    hands by ridge regression.'''
+    x = features(hands)
+    penalty = l2 * np.eye(x.shape[1])
+    penalty[-1, -1] = 0.0
+    return(np.linalg.solve(x.T @ x + penalty, x.T @ scores))
+
+
+def save(weights, path=WEIGHTS_PATH, **meta):
+    '''Writes weights to a JSON file, keyed by feature name.'''
+    with open(path, 'w') as f:
+        json.dump(dict(meta, weights=dict(zip(FEATURES, [round(float(weight), 6) for weight in weights]))), f, indent=1)
+
+
+def load(path=WEIGHTS_PATH):
+    '''Returns the weights read from a JSON file, keeping them for later
+    calls. Raises ValueError if a feature is missing.'''
+    global WEIGHTS
+    with open(path) as f:
+        named = json.load(f)['weights']
+    missing = set(FEATURES) - set(named)
+    if missing:
+        raise ValueError('weights are missing features: %s' % ', '.join(sorted(missing)))
+    WEIGHTS = np.array([named[name] for name in FEATURES], dtype=np.float64)
+    return(WEIGHTS)
+
+
+def predict_scores(hands, weights=None):
+    '''Returns an (N,) array of the predicted final scores of the players
+    holding a list of hands of length 2 strings.'''
+    weights = weights if weights is not None else WEIGHTS if WEIGHTS is not None else load()
+    if not len(hands):
+        return(np.zeros(0))
+    return(features(hands) @ weights)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Trains the score predictor on simulated games.')
+    parser.add_argument('--games', type=int, default=2000)
+    parser.add_argument('--seed', default=0)
+    parser.add_argument('--l2', type=float, default=1.0)
+    parser.add_argument('--output', default=WEIGHTS_PATH)
+    args = parser.parse_args()
+    hands, scores = simulate(args.games, args.seed)
+    save(train(hands, scores, args.l2), args.output, games=args.games, seed=args.seed, l2=args.l2)
+
+
+if __name__ == '__main__':
+    main()
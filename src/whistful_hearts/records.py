@@ -0,0 +1,161 @@
+import mmap
+import struct
+
+import numpy as np
+
+from .batch import score_batch, trick_winners
+from .core import CARD_ID, DECK
+
+# A record file starts with a header of a magic string, the format
+# version and the size of each record, followed by fixed width records
+# of 68 bytes: the card ids of the 13 tricks in the order played, the
+# 3 'deck_top' cards, the 9 cards drawn face down in the order drawn,
+# and the scores of each seat. Draws are 255 when not recorded.
+MAGIC = b'WHGR'
+VERSION = 1
+HEADER = struct.Struct('<4sHH8x')
+RECORD = np.dtype([('tricks', np.uint8, (13, 4)), ('deck_top', np.uint8, (3,)), ('draws', np.uint8, (9,)), ('scores', np.int8, (4,))])
+UNKNOWN = 255
+
+# Card id of each pair of ASCII bytes read as a little-endian integer,
+# for converting strings of cards without a dictionary lookup per card.
+LOOKUP = np.full(1 << 16, UNKNOWN, dtype=np.uint8)
+for card, index in CARD_ID.items():
+    LOOKUP[int.from_bytes(card.encode('ascii'), 'little')] = index
+DECK_ARRAY = np.array(DECK)
+
+
+def card_ids(cards, shape=None):
+    '''Returns a uint8 array of the card ids of an iterable of length 2
+    strings, reshaped if a shape is given. Raises ValueError if any card
+    is not recognised.'''
+    text = ''.join(cards).encode('ascii')
+    if len(text) % 2:
+        raise ValueError('cards must be length 2 strings')
+    ids = LOOKUP[np.frombuffer(text, dtype='<u2')]
+    if (ids == UNKNOWN).any():
+        raise ValueError('unknown card in %r' % text.decode())
+    return(ids if shape is None else ids.reshape(shape))
+
+
+def cards(ids):
+    '''Returns a list of length 2 strings for an array of card ids.'''
+    return(DECK_ARRAY[np.asarray(ids, dtype=np.intp)].tolist())
+
+
+def to_records(games, draws=None, scores=None):
+    '''Returns an array of records for a list of (tricks, deck_top)
+    pairs of length 2 strings, as accepted by 'score_game', with an
+    optional list of the draws of each game. Scores are computed unless
+    given.'''
+    records = np.zeros(len(games), dtype=RECORD)
+    records['tricks'] = card_ids((card for tricks, deck_top in games for trick in tricks for card in trick), (len(games), 13, 4))
+    records['deck_top'] = card_ids((card for tricks, deck_top in games for card in deck_top), (len(games), 3))
+    records['draws'] = UNKNOWN if draws is None else card_ids((card for stock in draws for card in stock), (len(games), 9))
+    records['scores'] = score_batch(records['tricks'], records['deck_top'])[1] if scores is None else scores
+    return(records)
+
+
+def from_games(games):
+    '''Returns an array of records for finished 'engine.Game' objects.'''
+    return(to_records([(game.tricks, game.deck_top) for game in games], [game.draws for game in games], [game.scores for game in games]))
+
+
+def game(record):
+    '''Returns the (tricks, deck_top) of a record as tuples of length 2
+    strings, as accepted by 'score_game' and 'play'.'''
+    tricks = cards(record['tricks'].ravel())
+    return([tuple(tricks[index:index + 4]) for index in range(0, 52, 4)], cards(record['deck_top']))
+
+
+def deals(records):
+    '''Returns an (N, 4, 10) array of the card ids dealt to each seat,
+    sorted by id, rebuilt from the plays and draws of each record.
+    Raises ValueError if the draws of any record are not known.'''
+    records = np.asarray(records, dtype=RECORD)
+    if (records['draws'] == UNKNOWN).any():
+        raise ValueError('deals can only be rebuilt from records with draws')
+    games = len(records)
+    tricks = records['tricks'].astype(np.intp)
+
+    # Seat of each card played, as the winner of a trick leads the next.
+    winners = np.cumsum(trick_winners(records['tricks'], records['deck_top']), axis=1) % 4
+    leaders = np.concatenate([np.zeros((games, 1), dtype=winners.dtype), winners[:, :-1]], axis=1)
+    seats = (leaders[:, :, None] + np.arange(4)) % 4
+    owner = np.empty((games, 52), dtype=np.intp)
+    np.put_along_axis(owner, tricks.reshape(games, 52), seats.reshape(games, 52), axis=1)
+
+    # Cards taken after the preliminary rounds were not dealt, and are
+    # moved past the four seats before sorting by seat, then by id.
+    np.put_along_axis(owner, records['deck_top'].astype(np.intp), 4, axis=1)
+    np.put_along_axis(owner, records['draws'].astype(np.intp), 4, axis=1)
+    order = np.sort(owner * 52 + np.arange(52), axis=1)[:, :40] % 52
+    return(order.reshape(games, 4, 10).astype(np.uint8))
+
+
+class RecordWriter():
+    '''Class writing records to a file, appending to it if it exists.'''
+
+    def __init__(self, path):
+        self.file = open(path, 'ab')
+        if self.file.tell() == 0:
+            self.file.write(HEADER.pack(MAGIC, VERSION, RECORD.itemsize))
+
+    def write(self, records):
+        '''Writes an array of records, or a single record.'''
+        self.file.write(np.ascontiguousarray(records, dtype=RECORD).tobytes())
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return(self)
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class RecordReader():
+    '''Class of a memory-mapped record file. 'records' is a zero-copy
+    array over the file, so that any game is read in constant time.'''
+
+    def __init__(self, path):
+        '''Accepts the path of a record file. Raises ValueError if it is
+        not a record file of this version.'''
+        with open(path, 'rb') as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, size = HEADER.unpack_from(self.map)
+        if magic != MAGIC or version != VERSION or size != RECORD.itemsize:
+            self.map.close()
+            raise ValueError('%s is not a version %d record file' % (path, VERSION))
+        count = (len(self.map) - HEADER.size) // RECORD.itemsize
+        self.records = np.frombuffer(self.map, dtype=RECORD, count=count, offset=HEADER.size)
+
+    def __len__(self):
+        return(len(self.records))
+
+    def __getitem__(self, index):
+        return(self.records[index])
+
+    def game(self, index):
+        '''Returns the (tricks, deck_top) of a game as length 2 strings.'''
+        return(game(self.records[index]))
+
+    def close(self):
+        '''Unmaps the file. Arrays taken from 'records' must be released
+        first.'''
+        del self.records
+        self.map.close()
+
+    def __enter__(self):
+        return(self)
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def write_records(path, records):
+    '''Writes an array of records to a new file.'''
+    open(path, 'wb').close()
+    with RecordWriter(path) as writer:
+        writer.write(records)
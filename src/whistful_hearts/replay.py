@@ -0,0 +1,177 @@
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from .core import PlayerData, is_valid_play, score_game
+from .engine import replay
+
+# A game is logged as one line of whitespace separated fields: the 40
+# cards dealt to seats 0 to 3, the 3 'deck_top' cards, the 9 cards drawn
+# face down, the 52 cards played in order, and the 4 scores recorded,
+# with cards written as their length 2 strings without separators.
+# For example (abbreviated) '2C9D...AS 9S0H7D 4C... 8DJD... 0,13,5,8'.
+
+
+class GameRecord():
+    '''Class of a game read from a log.'''
+
+    def __init__(self, deal, deck_top, draws, tricks, scores, offset=None, error=None):
+        '''Accepts the hands dealt to each seat, 'deck_top', the cards
+        drawn face down, the tricks played, the recorded scores, the
+        byte offset of the game in its log and, for a malformed line,
+        the error parsing it.'''
+        self.deal = deal
+        self.deck_top = deck_top
+        self.draws = draws
+        self.tricks = tricks
+        self.scores = scores
+        self.offset = offset
+        self.error = error
+
+
+def split_cards(text):
+    '''Returns a list of the length 2 strings in a string of cards.'''
+    return([text[index:index + 2] for index in range(0, len(text), 2)])
+
+
+def format_game(deal, deck_top, draws, tricks, scores):
+    '''Returns the log line of a game, without a line ending.'''
+    return(' '.join([''.join(card for hand in deal for card in hand), ''.join(deck_top), ''.join(draws), ''.join(card for trick in tricks for card in trick), ','.join(str(score) for score in scores)]))
+
+
+def parse_game(line, offset=None):
+    '''Returns the 'GameRecord' of a log line. Raises ValueError if the
+    line is malformed.'''
+    fields = line.split()
+    if len(fields) != 5:
+        raise ValueError('expected 5 fields, found %d' % len(fields))
+    deal, deck_top, draws, played, scores = fields
+    cards = split_cards(played)
+    return(GameRecord([split_cards(deal[20 * seat:20 * seat + 20]) for seat in range(4)], split_cards(deck_top), split_cards(draws), [tuple(cards[index:index + 4]) for index in range(0, len(cards), 4)], tuple(int(score) for score in scores.split(',')), offset))
+
+
+def write_games(f, games):
+    '''Writes finished 'engine.Game' objects to a log opened for writing
+    text.'''
+    for game in games:
+        f.write(format_game(game.deal, game.deck_top, game.draws, game.tricks, game.scores) + '\n')
+
+
+def read_games(f, start=0, end=None):
+    '''Yields the 'GameRecord' of each line of a log opened for reading
+    bytes, one at a time, with the error of any malformed line kept in
+    its record. Given a byte range, yields the games whose lines start
+    within it.'''
+    if start:
+        f.seek(start - 1)
+        f.readline()
+    offset = f.tell()
+    while end is None or offset < end:
+        line = f.readline()
+        if not line:
+            break
+        if line.strip():
+            try:
+                yield parse_game(line.decode('ascii'), offset)
+            except (ValueError, UnicodeDecodeError) as error:
+                yield GameRecord(None, None, None, None, None, offset, error)
+        offset += len(line)
+
+
+def validate_game(record, is_valid=is_valid_play):
+    '''Returns a list of the problems found replaying a game, checking
+    every play with 'is_valid' and comparing the recorded scores with
+    those of 'score_game'. Hearts being broken is tracked as the game
+    goes rather than recomputed over the whole history, through the
+    state passed to 'is_valid_play', or the 'broken' hook of any other
+    function with its signature.'''
+    problems = []
+    if len(record.tricks) != 13 or any(len(trick) != 4 for trick in record.tricks):
+        return(['expected 13 tricks of 4 cards'])
+    if len(record.draws) != 9:
+        return(['expected 9 cards drawn'])
+    try:
+        state = PlayerData(record.deck_top)
+        check = {'state': state} if is_valid is is_valid_play else {'broken': state.is_broken_hearts}
+        tricks = []
+
+        # Each seat plays once per trick, so their hand at the start of
+        # the trick is the one they play from.
+        for index, leader, hands in replay(record.deal, record.deck_top, record.draws, record.tricks):
+            trick = record.tricks[index]
+            for position, card in enumerate(trick):
+                seat = (leader + position) % 4
+                if not is_valid(card, trick[:position], hands[seat], tricks, **check):
+                    problems.append('trick %d: invalid play %s by seat %d' % (index + 1, card, seat))
+            tricks.append(trick)
+
+        scores = score_game(record.tricks, record.deck_top)
+        if scores != record.scores:
+            problems.append('recorded scores %s but scored %s' % (record.scores, scores))
+    except KeyError as error:
+        problems.append('unknown card %s' % error)
+    return(problems)
+
+
+def validate_stream(records, is_valid=is_valid_play):
+    '''Yields (offset, problems) for each game of a stream of records
+    from 'read_games' that has problems.'''
+    for record in records:
+        problems = ['malformed line: %s' % record.error] if record.error else validate_game(record, is_valid)
+        if problems:
+            yield(record.offset, problems)
+
+
+def validate_chunk(path, start, end):
+    '''Returns the number of games in a byte range of a log, and the
+    (offset, problems) of those with problems.'''
+    games = 0
+    flagged = []
+    with open(path, 'rb') as f:
+        for record in read_games(f, start, end):
+            games += 1
+            flagged += validate_stream([record])
+    return(games, flagged)
+
+
+def validate_chunk_args(args):
+    return(validate_chunk(*args))
+
+
+def validate_file(path, workers=None, chunk_size=1 << 24):
+    '''Returns the number of games in a log and the (offset, problems)
+    of those with problems, validating byte ranges of the file across
+    a pool of worker processes, or in process if 'workers' is 1.'''
+    size = os.path.getsize(path)
+    chunks = [(path, start, min(start + chunk_size, size)) for start in range(0, size, chunk_size)]
+    if workers == 1:
+        results = map(validate_chunk_args, chunks)
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        results = executor.map(validate_chunk_args, chunks)
+
+    games = 0
+    flagged = []
+    for count, problems in results:
+        games += count
+        flagged += problems
+    if workers != 1:
+        executor.shutdown()
+    return(games, flagged)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Validates and rescores a log of recorded games.')
+    parser.add_argument('path')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--chunk-size', type=int, default=1 << 24)
+    args = parser.parse_args()
+    games, flagged = validate_file(args.path, args.workers, args.chunk_size)
+    for offset, problems in flagged:
+        print(json.dumps({'offset': offset, 'problems': problems}))
+    print(json.dumps({'games': games, 'flagged': len(flagged)}))
+
+
+if __name__ == '__main__':
+    main()
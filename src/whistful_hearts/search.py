@@ -0,0 +1,231 @@
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .core import CARD_ID, DECK, SUIT, PlayerData, follow_suit, is_valid_play, legal_moves, play, score_game
+from .engine import Game
+
+# Attempts at dealing unseen cards around inferred voids before the
+# last attempt ignores them.
+ATTEMPTS = 20
+
+
+class Knowledge():
+    '''Class of what a player knows about a game at their turn, for use
+    in dealing out the cards they have not seen.'''
+
+    def __init__(self, curr_trick, hand, prev_tricks, deck_top, state=None):
+        '''Accepts the arguments of 'play', and optionally a 'PlayerData'
+        of the game to advance rather than walking the tricks again.
+        Raises ValueError if they are not consistent with a game dealt by
+        'engine.Game'.'''
+        self.curr = list(curr_trick)
+        self.hand = list(hand)
+        self.tricks = [tuple(trick) for trick in prev_tricks]
+        self.deck_top = list(deck_top)
+        state = PlayerData.resume(self.tricks, deck_top, state)
+
+        # Cards drawn by each player so far, and the number of cards each
+        # seat has played, being one per trick and any in this trick.
+        drawn = min(len(self.tricks), 3)
+        leader = state.leader
+        played = [len(self.tricks) + ((seat - leader) % 4 < len(self.curr)) for seat in range(4)]
+
+        # Suits players have failed to follow since their last draw, as
+        # those of the scoring rounds and of the current trick.
+        voids = list(state.voids)
+        ids = [CARD_ID[card] for card in self.curr]
+        for position, card in enumerate(ids):
+            if SUIT[card] != SUIT[ids[0]]:
+                voids[(leader + position) % 4] |= 1 << SUIT[ids[0]]
+        self.voids = [set(suit for suit in range(4) if mask >> suit & 1) for mask in voids]
+
+        # Holders of won prizes not played since.
+        cards = set(self.curr) | set(card for trick in self.tricks for card in trick)
+        held = {card: seat for card, seat in state.prizes.items() if card not in cards}
+
+        # Leader of the current trick and the seat of this player, with
+        # seat 0 leading the first trick.
+        self.leader = leader
+        self.seat = state.seat(self.curr)
+        if 10 + drawn - played[self.seat] != len(self.hand):
+            raise ValueError('hand size does not match the tricks played')
+
+        # Won prizes known to be held by each opponent, and how many
+        # unseen cards each opponent holds and are left to draw.
+        self.known = [[card for card, seat in held.items() if seat == other and other != self.seat] for other in range(4)]
+        self.counts = [0 if seat == self.seat else 10 + drawn - played[seat] - len(self.known[seat]) for seat in range(4)]
+        self.stockSize = 9 - 3 * drawn
+
+        # Cards not seen by this player.
+        seen = set(self.hand) | set(self.deck_top) | cards
+        self.pool = [card for card in DECK if card not in seen]
+        if len(self.pool) != sum(self.counts) + self.stockSize:
+            raise ValueError('unseen cards do not match the hands left to deal')
+
+    def sample(self, rng):
+        '''Returns the hands of each seat and the cards left to draw in
+        one random deal of the unseen cards, consistent with known voids
+        where possible.'''
+        opponents = sorted((seat for seat in range(4) if seat != self.seat), key=lambda seat: -len(self.voids[seat]))
+        for attempt in range(ATTEMPTS):
+            pool = list(self.pool)
+            rng.shuffle(pool)
+            hands = [list(cards) for cards in self.known]
+            hands[self.seat] = list(self.hand)
+
+            # Deals the most constrained players first, ignoring voids on
+            # the last attempt.
+            for seat in opponents:
+                voids = self.voids[seat] if attempt < ATTEMPTS - 1 else ()
+                cards = [card for card in pool if SUIT[CARD_ID[card]] not in voids][:self.counts[seat]]
+                if len(cards) < self.counts[seat]:
+                    break
+                hands[seat] += cards
+                taken = set(cards)
+                pool = [card for card in pool if card not in taken]
+            else:
+                return(hands, pool)
+
+    def rollout(self, card, hands, stock, policy):
+        '''Returns the cards played from this turn onwards and the score
+        of this player, when playing a card and then letting every seat
+        follow the policy for the rest of a deal.'''
+        hands = [list(cards) for cards in hands]
+        hands[self.seat].remove(card)
+        game = Game.resume([policy] * 4, hands, stock, self.tricks, self.curr + [card], self.leader, self.deck_top)
+        moves = tuple(move for trick in game.tricks[len(self.tricks):] for move in trick)[len(self.curr):]
+        return(moves, game.scores[self.seat])
+
+
+def run_rollouts(knowledge, legal, count, seed, deadline=None, policy=play):
+    '''Returns a list of (moves, score) rollouts over up to 'count'
+    deals of the unseen cards, stopping early after 'deadline' if given.
+    Every legal card is rolled out on each deal.'''
+    rng = random.Random(seed)
+    records = []
+    deals = 0
+    while count is None or deals < count:
+        if deadline is not None and deals and time.time() >= deadline:
+            break
+        hands, stock = knowledge.sample(rng)
+        for card in legal:
+            records.append(knowledge.rollout(card, hands, stock, policy))
+        deals += 1
+    return(records)
+
+
+def run_rollouts_args(args):
+    return(run_rollouts(*args))
+
+
+class SearchData():
+    '''Class of the 'player_data' of a 'Search' player, keeping the
+    rollouts of earlier moves in a game for reuse.'''
+
+    def __init__(self, deck_top):
+        self.deck = list(deck_top)
+
+        # State of the tricks seen so far, advanced on each move.
+        self.data = None
+
+        # Rollouts as (start, moves, score), where 'start' is the number
+        # of cards played in the game before 'moves'.
+        self.records = []
+
+    def reuse(self, history, stats):
+        '''Adds rollouts whose moves so far match the cards played since
+        to the statistics of the card they play at this turn, and drops
+        rollouts that no longer match.'''
+        kept = []
+        for start, moves, score in self.records:
+            played = len(history) - start
+            if 0 <= played < len(moves) and moves[:played] == tuple(history[start:]):
+                kept.append((start, moves, score))
+                if moves[played] in stats:
+                    stats[moves[played]][0] += score
+                    stats[moves[played]][1] += 1
+        self.records = kept
+
+
+class Search():
+    '''Class of a determinized Monte Carlo search player. Each move deals
+    the unseen cards at random, rolls out every legal card under the
+    policy and plays the card with the best mean score. Instances are
+    agents accepting the arguments of 'play'.'''
+
+    def __init__(self, rollouts=50, time_limit=None, workers=1, policy=play, seed=0):
+        '''Accepts the number of deals to roll out per move, an optional
+        time limit per move in seconds, the number of processes to roll
+        out over, the policy played in rollouts and a seed. Either limit
+        may be None, but not both.'''
+        if rollouts is None and time_limit is None:
+            raise ValueError('either rollouts or time_limit must be given')
+        self.rollouts = rollouts
+        self.timeLimit = time_limit
+        self.workers = workers
+        self.policy = policy
+        self.seed = seed
+        self.executor = None
+
+    def __getstate__(self):
+        return(dict(self.__dict__, executor=None))
+
+    def close(self):
+        '''Shuts down the process pool, if one was started.'''
+        if self.executor:
+            self.executor.shutdown()
+            self.executor = None
+
+    def search(self, knowledge, legal, seed):
+        '''Returns the rollouts of a move, spread over the process pool
+        when there is more than one worker.'''
+        deadline = time.time() + self.timeLimit if self.timeLimit is not None else None
+        if self.workers <= 1:
+            return(run_rollouts(knowledge, legal, self.rollouts, seed, deadline, self.policy))
+
+        if not self.executor:
+            self.executor = ProcessPoolExecutor(max_workers=self.workers)
+        count = -(-self.rollouts // self.workers) if self.rollouts is not None else None
+        tasks = [(knowledge, legal, count, '%s:%d' % (seed, worker), deadline, self.policy) for worker in range(self.workers)]
+        return([record for records in self.executor.map(run_rollouts_args, tasks) for record in records])
+
+    def __call__(self, curr_trick, hand, prev_tricks, deck_top, is_valid=is_valid_play, score=score_game, player_data=None, suppress_player_data=False):
+        '''Returns a card as 'play' does, with a 'SearchData' as the
+        optional second argument.'''
+        state = player_data if isinstance(player_data, SearchData) and player_data.deck == list(deck_top) else SearchData(deck_top)
+        state.data = PlayerData.resume(prev_tricks, deck_top, state.data)
+
+        # Legal cards in one pass, unless validating with another function,
+        # following suit when possible.
+        if is_valid is is_valid_play:
+            legal = legal_moves(state.data, hand, curr_trick) or list(hand)
+        else:
+            legal = [card for card in hand if is_valid(card, tuple(curr_trick), hand, prev_tricks)] or list(hand)
+        legal = follow_suit(legal, curr_trick)
+        history = [card for trick in prev_tricks for card in trick] + list(curr_trick)
+
+        # Total score and number of rollouts of each legal card, starting
+        # from rollouts of earlier moves that are still valid.
+        stats = {card: [0, 0] for card in legal}
+        state.reuse(history, stats)
+
+        card = legal[0]
+        if len(legal) > 1:
+            try:
+                knowledge = Knowledge(curr_trick, hand, prev_tricks, deck_top, state.data)
+            except ValueError:
+                knowledge = None
+
+            # Falls back on the policy for states the search cannot deal.
+            if knowledge is None:
+                card = self.policy(curr_trick, hand, prev_tricks, deck_top, suppress_player_data=True)
+            else:
+                records = self.search(knowledge, legal, '%s:%d:%s' % (self.seed, len(history), ''.join(hand)))
+                for moves, points in records:
+                    stats[moves[0]][0] += points
+                    stats[moves[0]][1] += 1
+                state.records += [(len(history), moves, points) for moves, points in records]
+                card = min((card for card in legal if stats[card][1]), key=lambda card: stats[card][0] / stats[card][1])
+
+        return(card if suppress_player_data else (card, state))
@@ -0,0 +1,257 @@
+import argparse
+import asyncio
+import json
+import time
+import zlib
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from .core import play
+
+# Items of 'player_data' returned to clients that ask for them.
+PLAYER_DATA = ('index', 'prize', 'trump', 'lead', 'tryShoot', 'brokenHearts', 'validPlay', 'countDiamonds', 'countClubs', 'countHearts', 'countSpades')
+
+# State of the tables assigned to this process, by table and seat,
+# from the least to the most recently used.
+TABLES = OrderedDict()
+
+# Seconds a table may go unused, and the most tables kept by a worker,
+# before the least recently used are dropped. Clients of a dropped table
+# are asked to send 'deck_top' and 'prev_tricks' again.
+TABLE_TTL = 600.0
+MAX_TABLES = 10000
+
+
+class Table():
+    '''Class of the state a worker keeps for a seat at a table, so later
+    requests only send the tricks completed since.'''
+
+    def __init__(self, deck_top, prev_tricks):
+        self.deck_top = list(deck_top)
+        self.tricks = [tuple(trick) for trick in prev_tricks]
+        self.data = None
+        self.used = time.monotonic()
+
+
+def configure(ttl, limit):
+    '''Sets the idle time and number of tables a worker keeps.'''
+    global TABLE_TTL, MAX_TABLES
+    TABLE_TTL = ttl
+    MAX_TABLES = limit
+
+
+def evict():
+    '''Drops the tables unused for longer than 'TABLE_TTL', and the least
+    recently used beyond 'MAX_TABLES'.'''
+    expired = time.monotonic() - TABLE_TTL
+    while TABLES and (len(TABLES) > MAX_TABLES or next(iter(TABLES.values())).used < expired):
+        TABLES.popitem(last=False)
+
+
+def decide(key, message):
+    '''Returns the card played for a request, and the public items of
+    'player_data' if asked for. A request with 'deck_top' and
+    'prev_tricks' starts the table afresh, while later ones may send only
+    the 'new_tricks' completed since. Raises KeyError for 'new_tricks'
+    of a table this worker does not hold, such as one dropped while
+    idle.'''
+    table = TABLES.get(key)
+    if 'prev_tricks' in message or table is None:
+        if 'prev_tricks' not in message or 'deck_top' not in message:
+            raise KeyError('unknown table, send deck_top and prev_tricks')
+        table = TABLES[key] = Table(message['deck_top'], message['prev_tricks'])
+    else:
+        table.tricks.extend(tuple(trick) for trick in message.get('new_tricks', ()))
+    TABLES.move_to_end(key)
+    table.used = time.monotonic()
+    evict()
+
+    card, table.data = play(message['curr_trick'], message['hand'], table.tricks, table.deck_top, player_data=table.data)
+    return(card, {name: table.data[name] for name in PLAYER_DATA} if message.get('player_data') else None)
+
+
+def forget(key):
+    '''Drops the state of a seat at a table.'''
+    TABLES.pop(key, None)
+
+
+def count_tables():
+    '''Returns the number of tables kept by this process.'''
+    evict()
+    return(len(TABLES))
+
+
+class Server():
+    '''Class of an asyncio server playing for many tables at once over a
+    line-delimited JSON protocol. Requests are objects with an 'op' of
+    'play', 'end' or 'stats' and an optional 'id' echoed in the reply.
+    Each table is pinned to one worker, which keeps its state between
+    requests and plays them in order, dropping tables left idle.'''
+
+    def __init__(self, workers=0, window=10000, ttl=TABLE_TTL, max_tables=MAX_TABLES):
+        '''Accepts the number of worker processes, with 0 playing in a
+        thread of this process, how many recent latencies to keep, and
+        the idle time in seconds and number of tables each worker keeps
+        tables for.'''
+        settings = {'initializer': configure, 'initargs': (ttl, max_tables)}
+        self.executors = [ProcessPoolExecutor(max_workers=1, **settings) for worker in range(workers)] or [ThreadPoolExecutor(max_workers=1, **settings)]
+        self.latencies = deque(maxlen=window)
+        self.requests = 0
+        self.errors = 0
+        self.started = time.perf_counter()
+
+    def executor(self, key):
+        '''Returns the worker of a table, stable across processes.'''
+        return(self.executors[zlib.crc32(repr(key).encode()) % len(self.executors)])
+
+    async def handle(self, message):
+        '''Returns the reply to a request.'''
+        started = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        reply = {'id': message.get('id')}
+        try:
+            op = message.get('op', 'play')
+            key = (str(message.get('table')), message.get('seat', 0))
+            if op == 'play':
+                reply['card'], data = await loop.run_in_executor(self.executor(key), decide, key, message)
+                if data is not None:
+                    reply['player_data'] = data
+            elif op == 'end':
+                await loop.run_in_executor(self.executor(key), forget, key)
+            elif op == 'stats':
+                reply['stats'] = dict(self.stats(), tables=await self.tables())
+            else:
+                raise ValueError('unknown op %r' % op)
+        except Exception as error:
+            self.errors += 1
+            reply['error'] = '%s: %s' % (type(error).__name__, error)
+
+        self.requests += 1
+        self.latencies.append(time.perf_counter() - started)
+        return(reply)
+
+    async def connection(self, reader, writer):
+        '''Serves the requests of one connection, replying as each
+        finishes so that slow tables do not hold up others.'''
+        lock = asyncio.Lock()
+        tasks = set()
+
+        async def respond(message):
+            reply = await self.handle(message)
+            async with lock:
+                writer.write((json.dumps(reply) + '\n').encode())
+                await writer.drain()
+
+        try:
+            async for line in reader:
+                if not line.strip():
+                    continue
+                try:
+                    message = json.loads(line)
+                except ValueError as error:
+                    message = {'op': 'invalid JSON (%s)' % error}
+                task = asyncio.ensure_future(respond(message))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+        finally:
+            writer.close()
+
+    async def tables(self):
+        '''Returns the number of tables kept over all workers.'''
+        loop = asyncio.get_running_loop()
+        return(sum(await asyncio.gather(*(loop.run_in_executor(executor, count_tables) for executor in self.executors))))
+
+    def stats(self):
+        '''Returns a dictionary of request counts, throughput, and p50
+        and p99 latency in milliseconds over recent requests.'''
+        latencies = sorted(self.latencies)
+        percentile = lambda fraction: latencies[min(len(latencies) - 1, int(fraction * len(latencies)))] * 1e3 if latencies else None
+        elapsed = time.perf_counter() - self.started
+        return({'requests': self.requests, 'errors': self.errors, 'throughput': self.requests / elapsed if elapsed else 0.0, 'p50': percentile(0.5), 'p99': percentile(0.99)})
+
+    async def serve_tcp(self, host='127.0.0.1', port=0):
+        '''Returns a started asyncio server listening on TCP.'''
+        return(await asyncio.start_server(self.connection, host, port))
+
+    async def serve_unix(self, path):
+        '''Returns a started asyncio server listening on a Unix socket.'''
+        return(await asyncio.start_unix_server(self.connection, path))
+
+    def close(self):
+        '''Shuts down the workers.'''
+        for executor in self.executors:
+            executor.shutdown()
+
+
+class Client():
+    '''Class of a client sending requests to a 'Server' and matching
+    replies by id. Without a connection it calls the server directly,
+    as a local stand-in for tests.'''
+
+    def __init__(self, server=None):
+        self.server = server
+        self.reader = None
+        self.writer = None
+        self.pending = {}
+        self.ids = 0
+
+    @classmethod
+    async def connect(cls, host='127.0.0.1', port=None, path=None):
+        '''Returns a client connected over TCP, or a Unix socket if a
+        path is given.'''
+        self = cls()
+        if path:
+            self.reader, self.writer = await asyncio.open_unix_connection(path)
+        else:
+            self.reader, self.writer = await asyncio.open_connection(host, port)
+        self.listener = asyncio.ensure_future(self.listen())
+        return(self)
+
+    async def listen(self):
+        async for line in self.reader:
+            reply = json.loads(line)
+            future = self.pending.pop(reply.get('id'), None)
+            if future and not future.done():
+                future.set_result(reply)
+
+    async def request(self, op='play', **fields):
+        '''Returns the reply to a request.'''
+        self.ids += 1
+        message = dict(fields, op=op, id=self.ids)
+        if self.server:
+            return(await self.server.handle(message))
+        future = asyncio.get_running_loop().create_future()
+        self.pending[self.ids] = future
+        self.writer.write((json.dumps(message) + '\n').encode())
+        await self.writer.drain()
+        return(await future)
+
+    async def close(self):
+        if self.writer:
+            self.listener.cancel()
+            self.writer.close()
+            await self.writer.wait_closed()
+
+
+async def serve(args):
+    server = Server(args.workers, ttl=args.ttl, max_tables=args.max_tables)
+    listener = await (server.serve_unix(args.unix) if args.unix else server.serve_tcp(args.host, args.port))
+    async with listener:
+        await listener.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serves the bot to many tables over line-delimited JSON.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=7777)
+    parser.add_argument('--unix', help='path of a Unix socket to listen on instead of TCP')
+    parser.add_argument('--workers', type=int, default=0)
+    parser.add_argument('--ttl', type=float, default=TABLE_TTL, help='seconds a table may go unused before it is dropped')
+    parser.add_argument('--max-tables', type=int, default=MAX_TABLES, help='most tables kept by each worker')
+    asyncio.run(serve(parser.parse_args()))
+
+
+if __name__ == '__main__':
+    main()
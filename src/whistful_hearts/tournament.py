@@ -0,0 +1,103 @@
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from .core import play
+from .engine import Game
+
+
+class Stats():
+    '''Class of statistics for each agent over a number of games. Stats
+    of separate shards merge by addition, so results do not depend on
+    how games were split between workers. A game counts once for each
+    seat an agent fills.'''
+
+    FIELDS = ('games', 'points', 'wins', 'moons', 'invalid')
+
+    def __init__(self):
+        self.agents = {}
+
+    def record(self, names, game):
+        '''Adds a finished game, given the agent name of each seat.'''
+        best = min(game.scores)
+        for seat, name in enumerate(names):
+            stats = self.agents.setdefault(name, dict.fromkeys(self.FIELDS, 0))
+            stats['games'] += 1
+            stats['points'] += game.scores[seat]
+            stats['wins'] += 1 if game.scores[seat] == best else 0
+            stats['moons'] += 1 if game.scores[seat] < 0 else 0
+            stats['invalid'] += game.invalid[seat]
+
+    def merge(self, other):
+        '''Adds the statistics of another 'Stats' to this one.'''
+        for name, stats in other.agents.items():
+            totals = self.agents.setdefault(name, dict.fromkeys(self.FIELDS, 0))
+            for field in self.FIELDS:
+                totals[field] += stats[field]
+        return(self)
+
+    def summary(self):
+        '''Returns a dictionary of statistics by agent name, including
+        the mean score and win rate.'''
+        return({name: dict(stats, mean=stats['points'] / stats['games'], winRate=stats['wins'] / stats['games']) for name, stats in sorted(self.agents.items())})
+
+
+def game_seed(seed, index):
+    '''Returns the seed of a game within a tournament. String seeds are
+    hashed identically in every process.'''
+    return('%s:%d' % (seed, index))
+
+
+def seating(names, index):
+    '''Returns the agent name of each seat for a game, rotating agents
+    through the seats between games.'''
+    return([names[(index + seat) % len(names)] for seat in range(4)])
+
+
+def run_shard(agents, seed, start, stop):
+    '''Returns the 'Stats' of games start to stop - 1 of a tournament.'''
+    names = sorted(agents)
+    stats = Stats()
+    for index in range(start, stop):
+        seats = seating(names, index)
+        stats.record(seats, Game([agents[name] for name in seats], game_seed(seed, index)))
+    return(stats)
+
+
+def run_shard_args(args):
+    return(run_shard(*args))
+
+
+def run_tournament(agents, games, seed=0, workers=None, shard_size=None):
+    '''Returns the merged 'Stats' of a number of games between agents,
+    given as a dictionary of names to picklable agents. Games are
+    sharded across a pool of worker processes, or played in process
+    if 'workers' is 1.'''
+    workers = workers or os.cpu_count() or 1
+    shard_size = shard_size or max(1, min(10000, games // (workers * 4) or 1))
+    shards = [(agents, seed, start, min(start + shard_size, games)) for start in range(0, games, shard_size)]
+
+    stats = Stats()
+    if workers == 1:
+        for shard in shards:
+            stats.merge(run_shard(*shard))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for shard in executor.map(run_shard_args, shards):
+                stats.merge(shard)
+    return(stats)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Plays a self-play tournament of the bot.')
+    parser.add_argument('--games', type=int, default=1000)
+    parser.add_argument('--seed', default=0)
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+    stats = run_tournament({'play': play}, args.games, seed=args.seed, workers=args.workers)
+    print(json.dumps(stats.summary(), indent=2, sort_keys=True))
+
+
+if __name__ == '__main__':
+    main()
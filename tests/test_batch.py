@@ -0,0 +1,39 @@
+import random
+
+import pytest
+
+from whistful_hearts.core import DECK, is_valid_play, play, score_game
+from whistful_hearts.engine import Game
+
+np = pytest.importorskip('numpy')
+from whistful_hearts.batch import encode_games, score_batch
+
+
+def random_agent(seed):
+    '''Returns an agent playing a random valid card.'''
+    rng = random.Random(seed)
+
+    def agent(curr_trick, hand, prev_tricks, deck_top, player_data=None):
+        return(rng.choice([card for card in hand if is_valid_play(card, tuple(curr_trick), hand, prev_tricks)] or hand))
+    return(agent)
+
+
+def test_score_batch_matches_score_game():
+    '''Batch scores equal 'score_game' over seeded games, and over random
+    orderings of the deck that need not be legal games.'''
+    games = []
+    for seed in range(300):
+        agents = [play] * 4 if seed % 2 else [random_agent('%d:%d' % (seed, seat)) for seat in range(4)]
+        game = Game(agents, seed)
+        games.append((game.tricks, game.deck_top))
+    rng = random.Random(0)
+    for attempt in range(300):
+        deck = list(DECK)
+        rng.shuffle(deck)
+        games.append(([tuple(deck[index:index + 4]) for index in range(0, 52, 4)], rng.sample(DECK, 3)))
+
+    winners, scores, shoot = score_batch(*encode_games(games))
+    for (tricks, deck_top), row, moon in zip(games, scores, shoot):
+        expected = score_game(tricks, deck_top)
+        assert tuple(int(score) for score in row) == expected, (tricks, deck_top)
+        assert bool(moon) == any(score < 0 for score in expected)
@@ -0,0 +1,37 @@
+import pytest
+
+from whistful_hearts.core import PlayerData, is_broken_hearts, is_valid_play, legal_moves, play
+from whistful_hearts.engine import Game
+
+
+def test_state_past_prev_tricks_is_not_trusted():
+    '''A state advanced past 'prev_tricks' gives the same answers as no
+    state, rather than those of its later tricks.'''
+    for seed in range(50):
+        game = Game([play] * 4, seed)
+        tricks = game.tricks
+        broken = next((index for index in range(4, 13) if is_broken_hearts(tricks[:index])), None)
+        if broken is not None:
+            break
+    state = PlayerData.resume(tricks[:broken], game.deck_top)
+    assert state.heartsBroken
+    assert is_valid_play('KH', (), ['KH', '7C'], tricks[:3], state=state) == is_valid_play('KH', (), ['KH', '7C'], tricks[:3]) == False
+    with pytest.raises(ValueError):
+        legal_moves(state, ['KH', '7C'], (), tricks[:3])
+
+
+def test_suit_counts_include_prev_tricks():
+    '''Suit counts of 'player_data' cover the hand, the current trick, the
+    overturned cards and every previous trick, whether the state is built
+    afresh or carried between calls.'''
+    calls = []
+
+    def agent(curr_trick, hand, prev_tricks, deck_top, player_data=None):
+        card, data = play(curr_trick, hand, prev_tricks, deck_top, player_data=player_data)
+        fresh = play(curr_trick, hand, prev_tricks, deck_top)[1]
+        calls.append((list(hand) + list(curr_trick) + list(deck_top) + [card for trick in prev_tricks for card in trick], dict(data), fresh))
+        return(card, data)
+    Game([agent, play, play, play], 0)
+    for cards, data, fresh in calls:
+        for suit, name in zip('CDHS', ('countClubs', 'countDiamonds', 'countHearts', 'countSpades')):
+            assert data[name] == fresh[name] == sum(1 for card in cards if card[1] == suit)
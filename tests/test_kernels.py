@@ -0,0 +1,94 @@
+import importlib.util
+import os
+import random
+
+import pytest
+
+from whistful_hearts import core
+from whistful_hearts.core import DECK, play
+
+
+@pytest.fixture(scope='module')
+def speedups():
+    '''Returns the compiled kernels, skipping tests that need them if the
+    extension has not been built.'''
+    return(pytest.importorskip('whistful_hearts._speedups'))
+
+
+@pytest.fixture(scope='module')
+def pure():
+    '''Returns a copy of 'core' loaded with WHISTFUL_HEARTS_PURE set, so it
+    keeps to the pure Python kernels.'''
+    spec = importlib.util.spec_from_file_location('whistful_hearts._pure', core.__file__)
+    module = importlib.util.module_from_spec(spec)
+    os.environ['WHISTFUL_HEARTS_PURE'] = '1'
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        del os.environ['WHISTFUL_HEARTS_PURE']
+    assert not module.SPEEDUPS
+    return(module)
+
+
+def outcome(function, *args):
+    '''Returns the result of a call, or the type of the error raised.'''
+    try:
+        return(function(*args))
+    except Exception as error:
+        return(type(error))
+
+
+def test_speedups_in_use(speedups):
+    assert core.SPEEDUPS
+    assert core.card_mask is speedups.card_mask
+
+
+def test_card_mask(speedups, pure):
+    rng = random.Random(0)
+    deck = list(DECK)
+    for attempt in range(2000):
+        rng.shuffle(deck)
+        cards = deck[:rng.randint(0, 13)]
+        assert speedups.card_mask(cards) == pure.card_mask(cards)
+    for cards in (['ZZ'], ['2C', '1H'], [5], ['AS ']):
+        assert outcome(speedups.card_mask, cards) == outcome(pure.card_mask, cards)
+
+
+def test_trick_winner(speedups, pure):
+    rng = random.Random(1)
+    for attempt in range(2000):
+        ids = rng.sample(range(52), rng.randint(1, 4))
+        trump = rng.choice([None, 0, 1, 2, 3])
+        index = rng.randint(0, 12)
+        assert speedups.trick_winner(ids, trump, index) == pure.trick_winner(ids, trump, index)
+    assert outcome(speedups.trick_winner, [], 0, 0) == outcome(pure.trick_winner, [], 0, 0)
+
+
+def test_score_tricks(speedups, pure):
+    rng = random.Random(2)
+    deck = list(DECK)
+    for attempt in range(500):
+        rng.shuffle(deck)
+        tricks = [tuple(deck[4 * index:4 * index + 4]) for index in range(rng.randint(0, 13))]
+        trump = rng.choice([None, 0, 1, 2, 3])
+        assert speedups.score_tricks(tricks, trump) == pure.score_tricks(tricks, trump)
+    assert outcome(speedups.score_tricks, [()], 0) == outcome(pure.score_tricks, [()], 0)
+
+
+def test_opening_play(monkeypatch):
+    '''Plays from the opening table match those of 'Play' in random
+    states of the preliminary rounds.'''
+    rng = random.Random(3)
+    deck = list(DECK)
+    for attempt in range(2000):
+        rng.shuffle(deck)
+        rounds = rng.randint(0, 2)
+        prev_tricks = [tuple(deck[4 * index:4 * index + 4]) for index in range(rounds)]
+        curr_trick = deck[12:12 + rng.randint(0, 3)]
+        hand = deck[15:25 + rounds]
+        deck_top = deck[49:52]
+        cards = []
+        for table in (True, False):
+            monkeypatch.setattr(core, 'OPENING_TABLE', table)
+            cards.append(play(curr_trick, hand, prev_tricks, deck_top, suppress_player_data=True))
+        assert cards[0] == cards[1], (curr_trick, hand, prev_tricks, deck_top)
@@ -0,0 +1,46 @@
+import random
+
+from whistful_hearts import core, instrument
+from whistful_hearts.core import DECK, STRATEGY, Strategy, play
+from whistful_hearts.openings import opening_play
+
+
+def states(count, seed):
+    '''Yields random (curr_trick, hand, prev_tricks, deck_top) of the
+    preliminary rounds.'''
+    rng = random.Random(seed)
+    deck = list(DECK)
+    for attempt in range(count):
+        rng.shuffle(deck)
+        rounds = rng.randint(0, 2)
+        yield(deck[12:12 + rng.randint(0, 3)], deck[15:25 + rounds], [tuple(deck[4 * index:4 * index + 4]) for index in range(rounds)], deck[49:52])
+
+
+def test_probe_records_leaf(monkeypatch):
+    '''Plays answered from the table are reported to the probe under the
+    leaf 'Play' would have decided them by.'''
+    records = []
+    monkeypatch.setattr(instrument, 'PROBE', instrument.Probe(records.append))
+    for state in states(500, 0):
+        for table in (True, False):
+            monkeypatch.setattr(core, 'OPENING_TABLE', table)
+            play(*state, suppress_player_data=True)
+    leaves = [record['leaf'] for record in records]
+    assert leaves[0::2] == leaves[1::2]
+    assert any(leaves)
+
+
+def test_other_strategy_skips_table(monkeypatch):
+    '''The table is not used for a strategy with other preliminary leaves,
+    whether given to 'play' or replacing the default.'''
+    table = dict(STRATEGY)
+    for leaf in table:
+        if leaf.startswith('preliminary round'):
+            table[leaf] = list(reversed(table[leaf]))
+    strategy = Strategy(table)
+    assert opening_play(*next(states(1, 1)), strategy=strategy) is None
+
+    monkeypatch.setattr(core, 'DEFAULT_STRATEGY', strategy)
+    for state in states(500, 1):
+        data = core.Data(state[1], curr=state[0], prev=state[2], deck=state[3]).data
+        assert play(*state, suppress_player_data=True) == core.Play(data, strategy).play
@@ -0,0 +1,33 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import whistful_hearts
+
+# Imports everything with NumPy blocked, then checks that a name of the
+# 'batch' extra still fails on access rather than being skipped.
+STAR_IMPORT = '''
+import sys
+sys.modules['numpy'] = None
+from whistful_hearts import *
+import whistful_hearts
+try:
+    whistful_hearts.score_batch
+except ImportError:
+    pass
+else:
+    raise AssertionError('score_batch imported without numpy')
+'''
+
+
+def test_star_import_without_numpy():
+    path = os.path.dirname(os.path.dirname(os.path.abspath(whistful_hearts.__file__)))
+    subprocess.run([sys.executable, '-c', STAR_IMPORT], check=True, env=dict(os.environ, PYTHONPATH=path))
+
+
+def test_numpy_names_resolve():
+    pytest.importorskip('numpy')
+    assert 'score_batch' not in whistful_hearts.__all__
+    assert callable(whistful_hearts.score_batch)
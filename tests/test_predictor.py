@@ -0,0 +1,18 @@
+import random
+
+import pytest
+
+from whistful_hearts.core import DECK, predict_score
+
+predictor = pytest.importorskip('whistful_hearts.predictor')
+
+
+def test_single_hand_matches_batch():
+    '''The pure Python 'predict_score' rounds the same prediction as the
+    vectorized 'predict_scores', so the two feature sets cannot drift.'''
+    rng = random.Random(0)
+    hands = [rng.sample(DECK, rng.randint(0, 13)) for attempt in range(5000)]
+    hands += [['QS'], ['QS', '2S', '3S'], ['2H', '3H', '4H', '5H', '6H', 'QS'], ['AH', 'KH']]
+    predictions = predictor.predict_scores(hands)
+    for hand, prediction in zip(hands, predictions):
+        assert predict_score(hand) == round(prediction), hand
@@ -0,0 +1,21 @@
+from whistful_hearts.core import CARD_ID, SUIT, play
+from whistful_hearts.engine import Game
+from whistful_hearts.search import Search
+
+
+def test_search_follows_suit():
+    '''Search follows the lead suit when it can, as the voids it infers
+    from other players assume.'''
+    search = Search(rollouts=4)
+    failed = []
+
+    def agent(curr_trick, hand, prev_tricks, deck_top, player_data=None):
+        card, data = search(curr_trick, hand, prev_tricks, deck_top, player_data=player_data)
+        if curr_trick:
+            lead = SUIT[CARD_ID[curr_trick[0]]]
+            if SUIT[CARD_ID[card]] != lead and any(SUIT[CARD_ID[option]] == lead for option in hand):
+                failed.append((curr_trick, hand, card))
+        return(card, data)
+    for seed in range(3):
+        Game([agent, play, agent, play], seed)
+    assert not failed
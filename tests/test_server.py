@@ -0,0 +1,70 @@
+import asyncio
+
+from whistful_hearts.core import play
+from whistful_hearts.engine import Game
+from whistful_hearts.server import Client, Server
+
+
+def turns(seed):
+    '''Returns the arguments of 'play' at each turn of seat 0 in a game.'''
+    calls = []
+
+    def agent(curr_trick, hand, prev_tricks, deck_top, player_data=None):
+        calls.append((list(curr_trick), list(hand), list(prev_tricks), list(deck_top)))
+        return(play(curr_trick, hand, prev_tricks, deck_top, suppress_player_data=True))
+    Game([agent, play, play, play], seed)
+    return(calls)
+
+
+async def play_table(client, table, calls):
+    '''Returns the replies to the turns of a table, sending 'prev_tricks'
+    with the first request and only 'new_tricks' after.'''
+    replies = []
+    sent = None
+    for curr_trick, hand, prev_tricks, deck_top in calls:
+        fields = {'table': table, 'curr_trick': curr_trick, 'hand': hand, 'player_data': True}
+        if sent is None:
+            fields.update(prev_tricks=prev_tricks, deck_top=deck_top)
+        else:
+            fields['new_tricks'] = prev_tricks[sent:]
+        sent = len(prev_tricks)
+        replies.append(await client.request(**fields))
+    return(replies)
+
+
+def test_plays_match():
+    async def run():
+        server = Server()
+        try:
+            client = Client(server)
+            calls = turns(0)
+            replies = await play_table(client, 't', calls)
+            assert [reply['card'] for reply in replies] == [play(*call, suppress_player_data=True) for call in calls]
+            assert (await client.request('end', table='t')).get('error') is None
+            stats = (await client.request('stats'))['stats']
+            assert stats['tables'] == 0 and stats['errors'] == 0
+        finally:
+            server.close()
+    asyncio.run(run())
+
+
+def test_evicted_table_is_refused():
+    async def run():
+        server = Server(max_tables=1)
+        try:
+            client = Client(server)
+            first, second = turns(1), turns(2)
+            await play_table(client, 'a', first[:4])
+            await play_table(client, 'b', second[:1])
+
+            # Table 'a' was dropped for 'b', so tricks sent since are refused
+            # rather than played from a table missing the earlier ones.
+            curr_trick, hand, prev_tricks, deck_top = first[4]
+            reply = await client.request(table='a', curr_trick=curr_trick, hand=hand, deck_top=deck_top, new_tricks=prev_tricks[-1:])
+            assert 'send deck_top and prev_tricks' in reply['error']
+            reply = await client.request(table='a', curr_trick=curr_trick, hand=hand, deck_top=deck_top, prev_tricks=prev_tricks, player_data=True)
+            assert reply['card'] == play(*first[4], suppress_player_data=True)
+            assert reply['player_data']['index'] == len(prev_tricks) + 1
+        finally:
+            server.close()
+    asyncio.run(run())
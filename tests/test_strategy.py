@@ -0,0 +1,38 @@
+import os
+
+import pytest
+
+from whistful_hearts.core import play
+from whistful_hearts.engine import Game
+
+# Games recorded from the original hand-coded 'Play', before it was
+# driven by the 'STRATEGY' table.
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'baseline_games.txt')
+
+
+def baseline_games():
+    '''Returns a list of (seed, tricks) of the recorded games.'''
+    games = []
+    with open(BASELINE) as f:
+        for line in f:
+            if line.strip() and not line.startswith('#'):
+                seed, played = line.split()
+                cards = [played[index:index + 2] for index in range(0, len(played), 2)]
+                games.append((int(seed), [tuple(cards[index:index + 4]) for index in range(0, 52, 4)]))
+    return(games)
+
+
+def suppressed(curr_trick, hand, prev_tricks, deck_top, player_data=None):
+    return(play(curr_trick, hand, prev_tricks, deck_top, suppress_player_data=True))
+
+
+@pytest.mark.parametrize('agent', [play, suppressed], ids=['player_data', 'suppressed'])
+def test_default_strategy_matches_baseline(agent):
+    '''Self-play with the default strategy table plays the recorded games
+    move for move, with and without 'player_data'.'''
+    games = baseline_games()
+    assert len(games) == 500
+    for seed, tricks in games:
+        game = Game([agent] * 4, seed)
+        assert game.tricks == tricks, seed
+        assert not any(game.invalid)